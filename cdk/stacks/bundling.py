@@ -0,0 +1,101 @@
+import platform
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+from typing import Optional
+
+import jsii
+from aws_cdk import BundlingOptions, ILocalBundling
+
+# Already on the Lambda Python runtime's path; pulled into layers only as
+# transitive dependencies (aws-xray-sdk -> botocore), so drop them.
+RUNTIME_PROVIDED_PACKAGES = ("boto3", "botocore", "s3transfer", "jmespath", "dateutil")
+
+
+def find_python_312() -> Optional[str]:
+    """Return a Python 3.12 interpreter path for local bundling, if any."""
+    if sys.version_info[:2] == (3, 12):
+        return sys.executable
+    return shutil.which("python3.12")
+
+
+@jsii.implements(ILocalBundling)
+class LocalLayerBundling:
+    """
+    Build a Python 3.12 arm64 layer on the host instead of in Docker.
+
+    Mirrors layer_bundling_command in the stack: aarch64 manylinux wheels are
+    installed with pip's cross-platform flags, pruned, and compiled to
+    sourceless .pyc. Uses the CDK app's own interpreter if it is 3.12,
+    otherwise python3.12 on PATH. Returns False (CDK then falls back to
+    Docker) when no Python 3.12 is found, since .pyc files are
+    version-specific, or when any step fails.
+    """
+
+    def __init__(self, layer_dir: str, pip_cache_dir: Path):
+        self.requirements = Path(layer_dir, "requirements.txt").resolve()
+        self.pip_cache_dir = pip_cache_dir
+
+    def try_bundle(self, output_dir: str, *, options: BundlingOptions) -> bool:
+        python = find_python_312()
+        if not python:
+            return False
+
+        output = Path(output_dir)
+        site_packages = output / "python"
+        try:
+            subprocess.run(
+                [
+                    python,
+                    "-m",
+                    "pip",
+                    "install",
+                    "--quiet",
+                    "--no-compile",
+                    "--cache-dir",
+                    str(self.pip_cache_dir),
+                    "--platform",
+                    "manylinux2014_aarch64",
+                    "--implementation",
+                    "cp",
+                    "--python-version",
+                    "3.12",
+                    "--only-binary=:all:",
+                    "-r",
+                    str(self.requirements),
+                    "-t",
+                    str(site_packages),
+                ],
+                check=True,
+            )
+
+            for package in RUNTIME_PROVIDED_PACKAGES:
+                shutil.rmtree(site_packages / package, ignore_errors=True)
+            for pattern in ("__pycache__", "tests", "*.dist-info"):
+                for path in list(site_packages.rglob(pattern)):
+                    if path.is_dir():
+                        shutil.rmtree(path, ignore_errors=True)
+            for path in site_packages.rglob("*.pyc"):
+                path.unlink()
+
+            subprocess.run(
+                [python, "-m", "compileall", "-q", "-b", str(site_packages)],
+                check=True,
+            )
+            for path in site_packages.rglob("*.py"):
+                path.unlink()
+
+            # Host strip only understands aarch64 objects on an aarch64 host
+            if platform.machine() in ("aarch64", "arm64"):
+                shared_objects = [str(p) for p in site_packages.rglob("*.so")]
+                if shared_objects:
+                    subprocess.run(
+                        ["strip", "--strip-unneeded", *shared_objects], check=True
+                    )
+        except (OSError, subprocess.CalledProcessError) as e:
+            print(f"Local layer bundling failed, falling back to Docker: {e}")
+            shutil.rmtree(site_packages, ignore_errors=True)
+            return False
+
+        return True
@@ -1,29 +1,111 @@
 import os
-from dotenv import load_dotenv
+import hashlib
+from pathlib import Path
+from dotenv import dotenv_values
 from aws_cdk import (
     Stack,
     Duration,
+    Size,
     RemovalPolicy,
     CfnOutput,
     BundlingOptions,
+    AssetHashType,
+    DockerVolume,
     aws_dynamodb as dynamodb,
     aws_lambda as lambda_,
     aws_apigateway as apigateway,
+    aws_apigatewayv2 as apigwv2,
+    aws_apigatewayv2_integrations as apigwv2_integrations,
     aws_sqs as sqs,
     aws_certificatemanager as acm,
     aws_route53 as route53,
     aws_route53_targets as targets,
     aws_lambda_event_sources as lambda_events,
+    aws_events as events,
+    aws_events_targets as events_targets,
 )
 from constructs import Construct
+from .bundling import RUNTIME_PROVIDED_PACKAGES, LocalLayerBundling
+
+# Load settings from .env file once; real environment variables take precedence
+env = {**dotenv_values(), **os.environ}
+
+# Validate everything required up front so synth fails before any construct
+required_env = ("PREFIX", "HOSTED_ZONE_ID", "HOSTED_ZONE_URL")
+missing_env = [name for name in required_env if not env.get(name)]
+if missing_env:
+    raise ValueError(f"{', '.join(missing_env)} must be set in .env file")
+
+prefix = env["PREFIX"]
+
+
+def env_int(name: str, default: int) -> int:
+    """Read an optional integer setting from the environment (.env file)."""
+    value = env.get(name)
+    return int(value) if value else default
+
+
+# Local build artifacts that must not be shipped with handler source
+function_asset_excludes = ["__pycache__", "*.pyc", ".pytest_cache"]
+
+# Set on every function. The dependency layer already ships compiled
+# bytecode and /var/task is read-only, so never try to write .pyc at runtime.
+runtime_environment = {"PYTHONDONTWRITEBYTECODE": "1"}
+
+# Lambda memory sizes (MB) default to the values in each construct and can be
+# overridden per function from .env with the results of AWS Lambda Power Tuning:
+# API_MEMORY_SIZE, AUTHORIZER_MEMORY_SIZE, WORKER_MEMORY_SIZE,
+# DLQ_PROCESSOR_MEMORY_SIZE, RECEIVER_MEMORY_SIZE
+
+# Provisioned concurrency for the hot-path Lambda aliases (API, Authorizer, Worker).
+# Defaults to 0 so dev deploys don't pay for always-warm environments.
+provisioned_concurrency = env_int("PROVISIONED_CONCURRENCY", 0)
+
+# SnapStart restores published versions from a snapshot taken after init
+# (imports, client setup) instead of re-running it on every cold start. Lambda
+# does not allow SnapStart and provisioned concurrency on the same version.
+snap_start = env.get("SNAP_START") == "1"
+if snap_start and provisioned_concurrency:
+    raise ValueError("SNAP_START cannot be combined with PROVISIONED_CONCURRENCY")
+snap_start_conf = lambda_.SnapStartConf.ON_PUBLISHED_VERSIONS if snap_start else None
+
+# API Gateway stage cache for the read-only polling GETs (1 = on). Billed
+# hourly for the 0.5 GB cluster whether or not it is hit, so it is opt-in.
+api_cache_enabled = env.get("API_CACHE_ENABLED") == "1"
+api_cache_ttl = Duration.seconds(30)
+
+# Status-filtered event listing uses tenant-status-index only once existing
+# events have tenantStatus (scripts/backfill_tenant_status.py); until then
+# the API falls back to the legacy status-index query (1 = backfill done).
+tenant_status_index_ready = env.get("TENANT_STATUS_INDEX_READY") == "1"
+
+# Layer build: drop packages the runtime already provides (boto3/botocore),
+# prune files Lambda never loads at init (bytecode caches, test suites, dist
+# metadata, debug symbols), then ship dependencies as sourceless .pyc compiled
+# by the same Python 3.12 the runtime uses, so imports skip parsing.
+layer_bundling_command = (
+    "pip install --no-compile -r requirements.txt -t /asset-output/python && "
+    + "rm -rf "
+    + " ".join(f"/asset-output/python/{p}" for p in RUNTIME_PROVIDED_PACKAGES)
+    + " && "
+    + "find /asset-output -type d -name '__pycache__' -prune -exec rm -rf {} + && "
+    + "find /asset-output -type d -name 'tests' -prune -exec rm -rf {} + && "
+    + "find /asset-output -type d -name '*.dist-info' -prune -exec rm -rf {} + && "
+    + "find /asset-output -name '*.pyc' -delete && "
+    + "python -m compileall -q -b /asset-output/python && "
+    + "find /asset-output -name '*.py' -delete && "
+    + "find /asset-output -name '*.so' -exec strip --strip-unneeded {} +"
+)
 
-# Load environment variables from .env file
-load_dotenv()
-
+# Reuse downloaded wheels across layer bundling runs
+pip_cache_dir = Path.home() / ".cache" / "pip"
 
-prefix = os.getenv("PREFIX")
-if not prefix:
-    raise ValueError("PREFIX must be set in .env file")
+# Read by the handlers' module-level botocore Config so warm invocations reuse
+# pooled keep-alive connections to DynamoDB/SQS instead of new TLS handshakes.
+boto_client_environment = {
+    "BOTO_TCP_KEEPALIVE": "1",
+    "BOTO_MAX_POOL_CONNECTIONS": str(env_int("BOTO_MAX_POOL_CONNECTIONS", 50)),
+}
 
 
 class WebhookDeliveryStack(Stack):
@@ -33,13 +115,8 @@ class WebhookDeliveryStack(Stack):
         # ============================================================
         # Route53 Hosted Zone (existing)
         # ============================================================
-        hosted_zone_id = os.getenv("HOSTED_ZONE_ID")
-        hosted_zone_url = os.getenv("HOSTED_ZONE_URL")
-
-        if not hosted_zone_id or not hosted_zone_url:
-            raise ValueError(
-                "HOSTED_ZONE_ID and HOSTED_ZONE_URL must be set in .env file"
-            )
+        hosted_zone_id = env["HOSTED_ZONE_ID"]
+        hosted_zone_url = env["HOSTED_ZONE_URL"]
 
         zone = route53.HostedZone.from_hosted_zone_attributes(
             self,
@@ -49,27 +126,23 @@ class WebhookDeliveryStack(Stack):
         )
 
         # ============================================================
-        # ACM Certificates for Custom Domains
+        # ACM Certificate for Custom Domains
         # ============================================================
+        # One certificate covers both API domains (SAN), so there is a single
+        # DNS-validated certificate to create and renew instead of two.
         hooks_domain_name = f"hooks.{hosted_zone_url}"
-        hooks_certificate = acm.Certificate(
-            self,
-            "TriggerApiCert",
-            domain_name=hooks_domain_name,
-            validation=acm.CertificateValidation.from_dns(zone),
-        )
-
         receiver_domain_name = f"receiver.{hosted_zone_url}"
-        receiver_certificate = acm.Certificate(
+        api_certificate = acm.Certificate(
             self,
-            "ReceiverApiCert",
-            domain_name=receiver_domain_name,
+            "ApiCertificate",
+            domain_name=hooks_domain_name,
+            subject_alternative_names=[receiver_domain_name],
             validation=acm.CertificateValidation.from_dns(zone),
         )
 
         # ============================================================
         # DynamoDB: TenantIdentity
-        # Schema: apiKey (PK) → { tenantId, status, plan, createdAt }
+        # Schema: apiKey (PK, SHA-256 hex of the key) → { tenantId, status, plan, createdAt }
         #
         # Purpose: Authentication and tenant identity only.
         # Contains NO webhook secrets or delivery configuration.
@@ -79,6 +152,11 @@ class WebhookDeliveryStack(Stack):
         # - Authorizer uses ProjectionExpression to limit fields retrieved
         # - Authorizer NEVER has access to TenantWebhookConfig (webhook secrets)
         # - API Lambda can read/write for tenant management (demo purposes)
+        #
+        # Kept as its own table rather than folded into a single-table design:
+        # table-level IAM grants are what keep the authorizer away from secrets
+        # and events, and the API Lambda never reads this table on ingest (the
+        # authorizer context already carries tenant identity).
         # ============================================================
         self.tenant_identity_table = dynamodb.Table(
             self,
@@ -122,8 +200,9 @@ class WebhookDeliveryStack(Stack):
         # ============================================================
         # DynamoDB: Events
         # Schema: tenantId (PK), eventId (SK)
-        # GSI: status-index (status PK, createdAt SK)
-        # Attributes: status, payload, targetUrl, attempts, lastAttemptAt, ttl
+        # GSI: tenant-status-index (tenantStatus PK, createdAt SK)
+        # Attributes: status, tenantStatus ("<tenantId>#<status>"), payload,
+        #             targetUrl, attempts, lastAttemptAt, ttl
         #
         # createdAt Schema: Stored as STRING containing epoch seconds (e.g., "1700000000").
         # This format ensures correct lexicographical ordering for GSI queries and is
@@ -143,11 +222,19 @@ class WebhookDeliveryStack(Stack):
                 type=dynamodb.AttributeType.STRING,
             ),
             billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST,
+            # Events are read a handful of times around delivery and then kept for
+            # a year of audit until TTL; storage dominates, so use Standard-IA
+            table_class=dynamodb.TableClass.STANDARD_INFREQUENT_ACCESS,
+            contributor_insights_enabled=False,
             removal_policy=RemovalPolicy.DESTROY,
             point_in_time_recovery=False,
             time_to_live_attribute="ttl",
         )
 
+        # Legacy index keyed on status alone; queried only until the
+        # tenantStatus backfill has run (TENANT_STATUS_INDEX_READY). CloudFormation
+        # allows one GSI creation/deletion per update, so it is removed in a
+        # follow-up deploy after that.
         self.events_table.add_global_secondary_index(
             index_name="status-index",
             partition_key=dynamodb.Attribute(
@@ -158,9 +245,27 @@ class WebhookDeliveryStack(Stack):
                 name="createdAt",
                 type=dynamodb.AttributeType.STRING,  # Epoch seconds as string: "1700000000"
             ),
+            # Unchanged: changing a GSI's projection replaces the index, which
+            # would be a second GSI change in the same update
             projection_type=dynamodb.ProjectionType.ALL,
         )
 
+        # Per-tenant status listing: the partition key already scopes the query
+        # to one tenant, so no FilterExpression reads other tenants' events.
+        self.events_table.add_global_secondary_index(
+            index_name="tenant-status-index",
+            partition_key=dynamodb.Attribute(
+                name="tenantStatus",
+                type=dynamodb.AttributeType.STRING,
+            ),
+            sort_key=dynamodb.Attribute(
+                name="createdAt",
+                type=dynamodb.AttributeType.STRING,
+            ),
+            projection_type=dynamodb.ProjectionType.INCLUDE,
+            non_key_attributes=["status", "attempts", "lastAttemptAt"],
+        )
+
         # ============================================================
         # SQS: Event Delivery Queue + DLQ
         # ============================================================
@@ -173,16 +278,16 @@ class WebhookDeliveryStack(Stack):
         )
 
         # Visibility timeout must exceed Worker Lambda timeout to prevent
-        # duplicate processing. Worker timeout is 60s, so visibility timeout
-        # is set to 180s (3x) to account for Lambda overhead and retries.
-        # If Lambda fails, message becomes visible again after 180s.
+        # duplicate processing. It is derived from the worker timeout (6x, per
+        # AWS guidance for SQS event sources) so the two cannot drift apart,
+        # covering batching window, Lambda overhead and retries.
+        # With the 60s worker timeout, a failed message reappears after 360s.
+        worker_timeout = Duration.seconds(60)
         self.events_queue = sqs.Queue(
             self,
             "EventsQueue",
             queue_name=f"{prefix}-EventsQueue",
-            visibility_timeout=Duration.seconds(
-                180
-            ),  # Must be > Worker Lambda timeout (60s)
+            visibility_timeout=Duration.seconds(worker_timeout.to_seconds() * 6),
             retention_period=Duration.days(4),
             dead_letter_queue=sqs.DeadLetterQueue(
                 max_receive_count=5,
@@ -191,6 +296,31 @@ class WebhookDeliveryStack(Stack):
             removal_policy=RemovalPolicy.DESTROY,
         )
 
+        # ============================================================
+        # Dependency Layers
+        # Third-party packages are installed once per layer; each function
+        # asset contains only its handler source and attaches only the layers
+        # it imports from, keeping per-function init small.
+        # - common: boto3 + X-Ray SDK (every function)
+        # - web: FastAPI/Mangum/pydantic (API + webhook receiver)
+        # - worker: requests (worker only)
+        # ============================================================
+        self.common_layer = self.python_layer(
+            "CommonDependenciesLayer",
+            "../src/layers/common",
+            "AWS SDK and tracing dependencies for webhook delivery functions",
+        )
+        self.web_layer = self.python_layer(
+            "WebDependenciesLayer",
+            "../src/layers/web",
+            "FastAPI/Mangum dependencies for the API and webhook receiver",
+        )
+        self.worker_layer = self.python_layer(
+            "WorkerDependenciesLayer",
+            "../src/layers/worker",
+            "HTTP client dependencies for the webhook delivery worker",
+        )
+
         # ============================================================
         # DLQ Processor Lambda (Manual Trigger)
         # Reads DLQ and requeues to main queue
@@ -201,64 +331,110 @@ class WebhookDeliveryStack(Stack):
             "DlqProcessorLambda",
             function_name=f"{prefix}-DlqProcessor",
             runtime=lambda_.Runtime.PYTHON_3_12,
+            architecture=lambda_.Architecture.ARM_64,
+            snap_start=snap_start_conf,
             handler="handler.main",
             code=lambda_.Code.from_asset(
-                "../src/dlq_processor",
-                bundling=BundlingOptions(
-                    image=lambda_.Runtime.PYTHON_3_12.bundling_image,
-                    command=[
-                        "bash",
-                        "-c",
-                        "pip install -r requirements.txt -t /asset-output && "
-                        + "cp -r . /asset-output",
-                    ],
-                ),
+                "../src/dlq_processor", exclude=function_asset_excludes
             ),
+            layers=[self.common_layer],
             timeout=Duration.seconds(300),
-            memory_size=512,
+            memory_size=env_int("DLQ_PROCESSOR_MEMORY_SIZE", 512),
             environment={
+                **runtime_environment,
                 "EVENTS_DLQ_URL": self.events_dlq.queue_url,
                 "EVENTS_QUEUE_URL": self.events_queue.queue_url,
+                "EVENTS_TABLE": self.events_table.table_name,
             },
         )
 
+        # Every function is invoked through a "live" alias on its published
+        # version, which is what SnapStart snapshots.
+        self.dlq_processor_alias = lambda_.Alias(
+            self,
+            "DlqProcessorLambdaAlias",
+            alias_name="live",
+            version=self.dlq_processor_lambda.current_version,
+        )
+
         self.events_dlq.grant_consume_messages(self.dlq_processor_lambda)
+        self.events_dlq.grant_purge(self.dlq_processor_lambda)
         self.events_queue.grant_send_messages(self.dlq_processor_lambda)
+        # Marks purged DLQ events as PURGED
+        self.events_table.grant_read_write_data(self.dlq_processor_lambda)
 
         # ============================================================
         # API Lambda (Event Ingestion)
-        # Bundled dependencies, no layer
+        # Dependencies from the common + web layers
         # ============================================================
         self.api_lambda = lambda_.Function(
             self,
             "ApiLambda",
             function_name=f"{prefix}-ApiHandler",
             runtime=lambda_.Runtime.PYTHON_3_12,
+            architecture=lambda_.Architecture.ARM_64,
+            snap_start=snap_start_conf,
             handler="main.handler",
-            code=lambda_.Code.from_asset(
-                "../src/api",
-                bundling=BundlingOptions(
-                    image=lambda_.Runtime.PYTHON_3_12.bundling_image,
-                    command=[
-                        "bash",
-                        "-c",
-                        "pip install -r requirements.txt -t /asset-output && "
-                        + "cp -r . /asset-output",
-                    ],
-                ),
-            ),
+            code=lambda_.Code.from_asset("../src/api", exclude=function_asset_excludes),
+            layers=[self.common_layer, self.web_layer],
+            # X-Ray traces (cold start vs. DynamoDB/SQS vs. webhook time) and
+            # Lambda Insights runtime metrics on the latency-sensitive functions
+            tracing=lambda_.Tracing.ACTIVE,
+            insights_version=lambda_.LambdaInsightsVersion.VERSION_1_0_229_0,
             timeout=Duration.seconds(30),
-            memory_size=1024,
+            memory_size=env_int("API_MEMORY_SIZE", 1024),
             environment={
+                **runtime_environment,
                 "TENANT_IDENTITY_TABLE": self.tenant_identity_table.table_name,
                 "TENANT_WEBHOOK_CONFIG_TABLE": self.tenant_webhook_config_table.table_name,
                 "EVENTS_TABLE": self.events_table.table_name,
                 "EVENTS_QUEUE_URL": self.events_queue.queue_url,
                 "EVENTS_DLQ_URL": self.events_dlq.queue_url,
-                "DLQ_PROCESSOR_FUNCTION_NAME": self.dlq_processor_lambda.function_name,
+                # Alias ARN, accepted as FunctionName by lambda:Invoke
+                "DLQ_PROCESSOR_FUNCTION_NAME": self.dlq_processor_alias.function_arn,
+                # Store the event row and enqueue it concurrently on ingest
+                "INGEST_PARALLEL": "1",
+                # Messages per SQS SendMessageBatch call for batch ingest
+                "SQS_BATCH": "10",
+                # Warm-container cache of tenant config lookups on ingest
+                "TENANT_CONFIG_CACHE_TTL_SECONDS": "60",
+                "TENANT_STATUS_INDEX_READY": "1" if tenant_status_index_ready else "0",
+                **boto_client_environment,
             },
         )
 
+        # "live" alias on the published version. API Gateway invokes the alias so
+        # provisioned concurrency (when enabled) removes the init phase from p99.
+        self.api_alias = lambda_.Alias(
+            self,
+            "ApiLambdaAlias",
+            alias_name="live",
+            version=self.api_lambda.current_version,
+            provisioned_concurrent_executions=provisioned_concurrency or None,
+        )
+
+        # With provisioned concurrency, scale the warm pool with traffic, keeping
+        # utilization around 70%. Without it, a scheduled ping keeps one warm
+        # environment around so the first request after an idle period does
+        # not pay the Python + FastAPI cold start.
+        if provisioned_concurrency:
+            self.api_alias.add_auto_scaling(
+                min_capacity=provisioned_concurrency,
+                max_capacity=max(provisioned_concurrency, 10),
+            ).scale_on_utilization(utilization_target=0.7)
+        else:
+            events.Rule(
+                self,
+                "ApiWarmer",
+                schedule=events.Schedule.rate(Duration.minutes(5)),
+                targets=[
+                    events_targets.LambdaFunction(
+                        self.api_alias,
+                        event=events.RuleTargetInput.from_object({"warmer": True}),
+                    )
+                ],
+            )
+
         # API Lambda IAM Permissions (Least Privilege):
         # - Read/write TenantIdentity: Tenant creation and management
         # - Read/write TenantWebhookConfig: Webhook config updates
@@ -271,39 +447,79 @@ class WebhookDeliveryStack(Stack):
         self.events_table.grant_read_write_data(self.api_lambda)
         self.events_queue.grant_send_messages(self.api_lambda)
         # DLQ management permissions
-        self.events_dlq.grant_consume_messages(self.api_lambda)
-        self.events_dlq.grant_purge(self.api_lambda)
-        self.dlq_processor_lambda.grant_invoke(self.api_lambda)
+        # Peek only (GET /v1/admin/dlq/messages); requeue and purge run in the
+        # DLQ Processor, so the API cannot delete or purge DLQ messages itself
+        self.events_dlq.grant(
+            self.api_lambda, "sqs:ReceiveMessage", "sqs:GetQueueAttributes"
+        )
+        self.dlq_processor_alias.grant_invoke(self.api_lambda)
 
         # ============================================================
         # Authorizer Lambda
         # Validates Bearer tokens and returns tenant context
+        #
+        # No Lambda in this stack is VPC-attached: they only call DynamoDB, SQS
+        # and public webhook URLs over the AWS public endpoints, so there is no
+        # ENI setup or NAT hop on the auth/ingest path. If a function ever needs
+        # a VPC (e.g. the worker for private webhook targets), add a DynamoDB
+        # gateway endpoint and an SQS interface endpoint to that VPC so those
+        # calls do not traverse a NAT Gateway.
         # ============================================================
         self.authorizer_lambda = lambda_.Function(
             self,
             "AuthorizerLambda",
             function_name=f"{prefix}-Authorizer",
             runtime=lambda_.Runtime.PYTHON_3_12,
+            architecture=lambda_.Architecture.ARM_64,
+            snap_start=snap_start_conf,
             handler="handler.handler",
             code=lambda_.Code.from_asset(
-                "../src/authorizer",
-                bundling=BundlingOptions(
-                    image=lambda_.Runtime.PYTHON_3_12.bundling_image,
-                    command=[
-                        "bash",
-                        "-c",
-                        "pip install -r requirements.txt -t /asset-output && "
-                        + "cp -r . /asset-output",
-                    ],
-                ),
+                "../src/authorizer", exclude=function_asset_excludes
             ),
+            layers=[self.common_layer],
+            tracing=lambda_.Tracing.ACTIVE,
+            insights_version=lambda_.LambdaInsightsVersion.VERSION_1_0_229_0,
             timeout=Duration.seconds(10),
-            memory_size=256,
+            # Lambda allocates CPU in proportion to memory. The authorizer sits on
+            # the synchronous path of every request, so it gets a full vCPU for
+            # cold-start imports and cache-miss lookups; it runs for a few ms, so
+            # the extra memory costs little.
+            memory_size=env_int("AUTHORIZER_MEMORY_SIZE", 1792),
             environment={
+                **runtime_environment,
                 "TENANT_IDENTITY_TABLE": self.tenant_identity_table.table_name,
+                **boto_client_environment,
             },
         )
 
+        # The authorizer sits in front of every authenticated request, so it gets
+        # the same "live" alias treatment as the API Lambda.
+        self.authorizer_alias = lambda_.Alias(
+            self,
+            "AuthorizerLambdaAlias",
+            alias_name="live",
+            version=self.authorizer_lambda.current_version,
+            provisioned_concurrent_executions=provisioned_concurrency or None,
+        )
+
+        if provisioned_concurrency:
+            self.authorizer_alias.add_auto_scaling(
+                min_capacity=provisioned_concurrency,
+                max_capacity=max(provisioned_concurrency, 5),
+            ).scale_on_utilization(utilization_target=0.7)
+        else:
+            events.Rule(
+                self,
+                "AuthorizerWarmer",
+                schedule=events.Schedule.rate(Duration.minutes(5)),
+                targets=[
+                    events_targets.LambdaFunction(
+                        self.authorizer_alias,
+                        event=events.RuleTargetInput.from_object({"warmer": True}),
+                    )
+                ],
+            )
+
         # Authorizer Lambda IAM Permissions (Strict Least Privilege):
         # - Read-only TenantIdentity: Validates API keys, returns tenant context
         # - NO access to TenantWebhookConfig: Never sees webhook secrets
@@ -313,32 +529,36 @@ class WebhookDeliveryStack(Stack):
 
         # ============================================================
         # Worker Lambda (Webhook Delivery)
-        # SQS triggered, bundled dependencies
+        # SQS triggered, dependencies from the common + worker layers
         # ============================================================
         self.worker_lambda = lambda_.Function(
             self,
             "WorkerLambda",
             function_name=f"{prefix}-WorkerHandler",
             runtime=lambda_.Runtime.PYTHON_3_12,
+            architecture=lambda_.Architecture.ARM_64,
+            snap_start=snap_start_conf,
             handler="handler.main",
             code=lambda_.Code.from_asset(
-                "../src/worker",
-                bundling=BundlingOptions(
-                    image=lambda_.Runtime.PYTHON_3_12.bundling_image,
-                    command=[
-                        "bash",
-                        "-c",
-                        "pip install -r requirements.txt -t /asset-output && "
-                        + "cp -r . /asset-output",
-                    ],
-                ),
+                "../src/worker", exclude=function_asset_excludes
             ),
-            timeout=Duration.seconds(60),
-            memory_size=1024,
+            layers=[self.common_layer, self.worker_layer],
+            tracing=lambda_.Tracing.ACTIVE,
+            insights_version=lambda_.LambdaInsightsVersion.VERSION_1_0_229_0,
+            timeout=worker_timeout,
+            # 1769 MB is the smallest size that gets a full vCPU, which the worker
+            # needs for JSON encoding, HMAC signing and TLS handshakes across a
+            # concurrent batch. Override with WORKER_MEMORY_SIZE after power tuning.
+            memory_size=env_int("WORKER_MEMORY_SIZE", 1769),
             environment={
+                **runtime_environment,
                 "TENANT_WEBHOOK_CONFIG_TABLE": self.tenant_webhook_config_table.table_name,
+                "TENANT_CONFIG_CACHE_TTL_SECONDS": "60",
                 "EVENTS_TABLE": self.events_table.table_name,
+                # For ChangeMessageVisibility (granted by the SQS event source)
+                "EVENTS_QUEUE_URL": self.events_queue.queue_url,
                 "EVENTS_DLQ_URL": self.events_dlq.queue_url,
+                **boto_client_environment,
             },
         )
 
@@ -351,11 +571,27 @@ class WebhookDeliveryStack(Stack):
         self.tenant_webhook_config_table.grant_read_data(self.worker_lambda)
         self.events_dlq.grant_send_messages(self.worker_lambda)
 
-        self.worker_lambda.add_event_source(
+        self.worker_alias = lambda_.Alias(
+            self,
+            "WorkerLambdaAlias",
+            alias_name="live",
+            version=self.worker_lambda.current_version,
+            provisioned_concurrent_executions=provisioned_concurrency or None,
+        )
+
+        self.worker_alias.add_event_source(
             lambda_events.SqsEventSource(
                 self.events_queue,
+                # Small batches with a short window: fills batches under load
+                # without holding a lone message for long before delivery
                 batch_size=10,
-                max_batching_window=Duration.seconds(0),
+                max_batching_window=Duration.seconds(2),
+                # Worker returns batchItemFailures so only failed messages
+                # are retried instead of the whole batch
+                report_batch_item_failures=True,
+                # Cap concurrent worker invocations so bursts don't hammer
+                # DynamoDB partitions or a single tenant's endpoint
+                max_concurrency=env_int("WORKER_MAX_CONCURRENCY", 50),
             )
         )
 
@@ -367,23 +603,20 @@ class WebhookDeliveryStack(Stack):
             "WebhookReceiverLambda",
             function_name=f"{prefix}-WebhookReceiver",
             runtime=lambda_.Runtime.PYTHON_3_12,
+            architecture=lambda_.Architecture.ARM_64,
+            snap_start=snap_start_conf,
             handler="main.handler",
             code=lambda_.Code.from_asset(
-                "../src/webhook_receiver",
-                bundling=BundlingOptions(
-                    image=lambda_.Runtime.PYTHON_3_12.bundling_image,
-                    command=[
-                        "bash",
-                        "-c",
-                        "pip install -r requirements.txt -t /asset-output && "
-                        + "cp -r . /asset-output",
-                    ],
-                ),
+                "../src/webhook_receiver", exclude=function_asset_excludes
             ),
+            layers=[self.common_layer, self.web_layer],
             timeout=Duration.seconds(10),  # Webhook validation should be fast
-            memory_size=256,  # Minimal memory needed for signature validation
+            # Minimal memory needed for signature validation
+            memory_size=env_int("RECEIVER_MEMORY_SIZE", 256),
             environment={
+                **runtime_environment,
                 "TENANT_WEBHOOK_CONFIG_TABLE": self.tenant_webhook_config_table.table_name,
+                "TENANT_CONFIG_CACHE_TTL_SECONDS": "60",
             },
         )
 
@@ -395,15 +628,26 @@ class WebhookDeliveryStack(Stack):
             self.webhook_receiver_lambda
         )
 
+        self.webhook_receiver_alias = lambda_.Alias(
+            self,
+            "WebhookReceiverLambdaAlias",
+            alias_name="live",
+            version=self.webhook_receiver_lambda.current_version,
+        )
+
         # ============================================================
-        # API Gateway Token Authorizer
+        # API Gateway Request Authorizer
         # ============================================================
-        self.token_authorizer = apigateway.TokenAuthorizer(
+        # Cached by the Authorization header only. Policies are wildcarded to the
+        # whole API, so one cached result serves every route for the token;
+        # adding the path to the identity sources would only lower the hit rate.
+        # Key revocation takes effect within 1 hour.
+        self.api_authorizer = apigateway.RequestAuthorizer(
             self,
-            "ApiTokenAuthorizer",
-            handler=self.authorizer_lambda,
-            identity_source="method.request.header.Authorization",
-            results_cache_ttl=Duration.minutes(5),
+            "ApiRequestAuthorizer",
+            handler=self.authorizer_alias,
+            identity_sources=[apigateway.IdentitySource.header("Authorization")],
+            results_cache_ttl=Duration.minutes(60),
         )
 
         # ============================================================
@@ -420,22 +664,37 @@ class WebhookDeliveryStack(Stack):
             "TriggerApi",
             rest_api_name="Webhook Delivery API",
             description="Multi-tenant webhook delivery with SQS-backed processing",
+            # API Gateway gzips responses above 1 KB when the client sends
+            # Accept-Encoding (docs/openapi.json and event listings), so the
+            # FastAPI app deliberately has no compression middleware.
+            min_compression_size=Size.bytes(1024),
             deploy_options=apigateway.StageOptions(
                 stage_name="prod",
                 throttling_rate_limit=500,
                 throttling_burst_limit=1000,
+                tracing_enabled=True,
+                metrics_enabled=True,
+                # Full request/response logging is costly and would log payloads
+                data_trace_enabled=False,
+                cache_cluster_enabled=api_cache_enabled,
+                cache_cluster_size="0.5" if api_cache_enabled else None,
+                method_options=(
+                    {
+                        path: apigateway.MethodDeploymentOptions(
+                            caching_enabled=True, cache_ttl=api_cache_ttl
+                        )
+                        for path in (
+                            "/v1/events/GET",
+                            "/v1/events/{eventId}/GET",
+                            "/v1/tenants/{tenantId}/GET",
+                        )
+                    }
+                    if api_cache_enabled
+                    else None
+                ),
             ),
-            default_cors_preflight_options=apigateway.CorsOptions(
-                allow_origins=["*"],
-                allow_methods=apigateway.Cors.ALL_METHODS,
-                allow_headers=[
-                    "Content-Type",
-                    "Authorization",
-                    "X-Amz-Date",
-                    "X-Api-Key",
-                    "X-Amz-Security-Token",
-                ],
-            ),
+            # No CORS preflight: the trigger API is called server-to-server, and
+            # the docs pages are served from the same origin they call.
         )
 
         # v1 resource group
@@ -443,10 +702,23 @@ class WebhookDeliveryStack(Stack):
 
         # Lambda integration with proxy
         lambda_integration = apigateway.LambdaIntegration(
-            self.api_lambda,
+            self.api_alias,
             proxy=True,
         )
 
+        # Cached GETs get their own integration so the cache key includes the
+        # Authorization header: without it, one tenant's cached response would
+        # be served to another tenant polling the same path.
+        def cached_integration(*cache_key_parameters: str):
+            return apigateway.LambdaIntegration(
+                self.api_alias,
+                proxy=True,
+                cache_key_parameters=[
+                    "method.request.header.Authorization",
+                    *cache_key_parameters,
+                ],
+            )
+
         # Documentation resources (no auth required)
         docs_resource = v1_resource.add_resource("docs")
         docs_resource.add_method("GET", lambda_integration)
@@ -465,16 +737,30 @@ class WebhookDeliveryStack(Stack):
             "POST",
             lambda_integration,
             authorization_type=apigateway.AuthorizationType.CUSTOM,
-            authorizer=self.token_authorizer,
+            authorizer=self.api_authorizer,
+        )
+
+        # POST /v1/events/batch - Create up to 100 events
+        events_batch_resource = events_resource.add_resource("batch")
+        events_batch_resource.add_method(
+            "POST",
+            lambda_integration,
+            authorization_type=apigateway.AuthorizationType.CUSTOM,
+            authorizer=self.api_authorizer,
         )
 
         # GET /v1/events - List events
         events_resource.add_method(
             "GET",
-            lambda_integration,
+            cached_integration(
+                "method.request.querystring.status",
+                "method.request.querystring.limit",
+                "method.request.querystring.next_token",
+            ),
             authorization_type=apigateway.AuthorizationType.CUSTOM,
-            authorizer=self.token_authorizer,
+            authorizer=self.api_authorizer,
             request_parameters={
+                "method.request.header.Authorization": True,
                 "method.request.querystring.status": False,
                 "method.request.querystring.limit": False,
                 "method.request.querystring.next_token": False,
@@ -485,10 +771,11 @@ class WebhookDeliveryStack(Stack):
         event_id_resource = events_resource.add_resource("{eventId}")
         event_id_resource.add_method(
             "GET",
-            lambda_integration,
+            cached_integration("method.request.path.eventId"),
             authorization_type=apigateway.AuthorizationType.CUSTOM,
-            authorizer=self.token_authorizer,
+            authorizer=self.api_authorizer,
             request_parameters={
+                "method.request.header.Authorization": True,
                 "method.request.path.eventId": True,
             },
         )
@@ -499,7 +786,7 @@ class WebhookDeliveryStack(Stack):
             "POST",
             lambda_integration,
             authorization_type=apigateway.AuthorizationType.CUSTOM,
-            authorizer=self.token_authorizer,
+            authorizer=self.api_authorizer,
         )
 
         # Tenants endpoints
@@ -517,10 +804,11 @@ class WebhookDeliveryStack(Stack):
         tenant_id_resource = tenants_resource.add_resource("{tenantId}")
         tenant_id_resource.add_method(
             "GET",
-            lambda_integration,
+            cached_integration("method.request.path.tenantId"),
             authorization_type=apigateway.AuthorizationType.CUSTOM,
-            authorizer=self.token_authorizer,
+            authorizer=self.api_authorizer,
             request_parameters={
+                "method.request.header.Authorization": True,
                 "method.request.path.tenantId": True,
             },
         )
@@ -528,7 +816,7 @@ class WebhookDeliveryStack(Stack):
             "PATCH",
             lambda_integration,
             authorization_type=apigateway.AuthorizationType.CUSTOM,
-            authorizer=self.token_authorizer,
+            authorizer=self.api_authorizer,
         )
 
         # Admin DLQ Management endpoints (all with authorizer)
@@ -541,7 +829,7 @@ class WebhookDeliveryStack(Stack):
             "GET",
             lambda_integration,
             authorization_type=apigateway.AuthorizationType.CUSTOM,
-            authorizer=self.token_authorizer,
+            authorizer=self.api_authorizer,
             request_parameters={
                 "method.request.querystring.limit": False,
             },
@@ -553,7 +841,7 @@ class WebhookDeliveryStack(Stack):
             "POST",
             lambda_integration,
             authorization_type=apigateway.AuthorizationType.CUSTOM,
-            authorizer=self.token_authorizer,
+            authorizer=self.api_authorizer,
         )
 
         # POST /v1/admin/dlq/purge - Purge DLQ
@@ -562,119 +850,84 @@ class WebhookDeliveryStack(Stack):
             "POST",
             lambda_integration,
             authorization_type=apigateway.AuthorizationType.CUSTOM,
-            authorizer=self.token_authorizer,
+            authorizer=self.api_authorizer,
         )
 
         # ============================================================
         # Receiver API Gateway (Separate from Main API)
+        # HTTP API (v2): no authorizer, usage plans or REST-only stage features
+        # are needed here, and it adds less per-request overhead than REST.
         # ============================================================
-        self.receiver_api = apigateway.RestApi(
+        # Custom domain for receiver API (REGIONAL, mapped to the $default stage)
+        # URLs: https://receiver.vincentchan.cloud/{tenantId}/webhook
+        receiver_custom_domain = apigwv2.DomainName(
             self,
-            "ReceiverApi",
-            rest_api_name="Webhook Receiver API",
+            "ReceiverHttpApiCustomDomain",
+            domain_name=receiver_domain_name,
+            certificate=api_certificate,
+        )
+
+        self.receiver_api = apigwv2.HttpApi(
+            self,
+            "ReceiverHttpApi",
+            api_name="Webhook Receiver API",
             description="Multi-tenant webhook receiver with HMAC validation",
-            deploy_options=apigateway.StageOptions(
-                stage_name="prod",
-                throttling_rate_limit=1000,
-                throttling_burst_limit=2000,
-            ),
-            default_cors_preflight_options=apigateway.CorsOptions(
+            create_default_stage=False,
+            cors_preflight=apigwv2.CorsPreflightOptions(
                 allow_origins=["*"],
-                allow_methods=apigateway.Cors.ALL_METHODS,
+                allow_methods=[apigwv2.CorsHttpMethod.ANY],
                 allow_headers=[
                     "Content-Type",
                     "Stripe-Signature",
                 ],
+                # Let browsers reuse a preflight result for a day
+                max_age=Duration.hours(24),
             ),
         )
 
-        # Tenant-specific webhook endpoint: /{tenantId}/webhook
-        tenant_resource = self.receiver_api.root.add_resource("{tenantId}")
-        webhook_resource = tenant_resource.add_resource("webhook")
-
-        # POST method for webhook reception (no auth - validated via HMAC)
-        webhook_resource.add_method(
-            "POST",
-            apigateway.LambdaIntegration(
-                self.webhook_receiver_lambda,
-                proxy=True,
+        # $default stage: no stage prefix in the path, so FastAPI sees the same
+        # routes it did behind the REST API's root base path mapping
+        self.receiver_api.add_stage(
+            "ReceiverHttpApiDefaultStage",
+            stage_name="$default",
+            auto_deploy=True,
+            throttle=apigwv2.ThrottleSettings(
+                rate_limit=1000,
+                burst_limit=2000,
             ),
-            request_parameters={
-                "method.request.path.tenantId": True,
-                "method.request.header.Stripe-Signature": False,
-            },
-        )
-
-        # Global control endpoints for testing retry functionality
-        # POST /enable - Enable webhook reception globally (all tenants)
-        enable_resource = self.receiver_api.root.add_resource("enable")
-        enable_resource.add_method(
-            "POST",
-            apigateway.LambdaIntegration(
-                self.webhook_receiver_lambda,
-                proxy=True,
+            domain_mapping=apigwv2.DomainMappingOptions(
+                domain_name=receiver_custom_domain,
             ),
         )
 
-        # POST /disable - Disable webhook reception globally (all tenants)
-        disable_resource = self.receiver_api.root.add_resource("disable")
-        disable_resource.add_method(
-            "POST",
-            apigateway.LambdaIntegration(
-                self.webhook_receiver_lambda,
-                proxy=True,
-            ),
+        receiver_integration = apigwv2_integrations.HttpLambdaIntegration(
+            "ReceiverIntegration",
+            self.webhook_receiver_alias,
         )
 
-        # GET /status - Get global webhook reception status
-        status_resource = self.receiver_api.root.add_resource("status")
-        status_resource.add_method(
-            "GET",
-            apigateway.LambdaIntegration(
-                self.webhook_receiver_lambda,
-                proxy=True,
-            ),
+        # Tenant-specific webhook endpoint (no auth - validated via HMAC)
+        self.receiver_api.add_routes(
+            path="/{tenantId}/webhook",
+            methods=[apigwv2.HttpMethod.POST],
+            integration=receiver_integration,
         )
 
-        # Health check endpoint: /health
-        health_resource = self.receiver_api.root.add_resource("health")
-        health_resource.add_method(
-            "GET",
-            apigateway.LambdaIntegration(
-                self.webhook_receiver_lambda,
-                proxy=True,
-            ),
-        )
-
-        # Documentation endpoints: /docs
-        docs_resource = self.receiver_api.root.add_resource("docs")
-        docs_resource.add_method(
-            "GET",
-            apigateway.LambdaIntegration(
-                self.webhook_receiver_lambda,
-                proxy=True,
-            ),
-        )
-
-        # OpenAPI schema endpoint: /openapi.json
-        openapi_resource = self.receiver_api.root.add_resource("openapi.json")
-        openapi_resource.add_method(
-            "GET",
-            apigateway.LambdaIntegration(
-                self.webhook_receiver_lambda,
-                proxy=True,
-            ),
-        )
+        # Global control endpoints for testing retry functionality
+        # POST /enable, POST /disable - Toggle webhook reception (all tenants)
+        for path in ["/enable", "/disable"]:
+            self.receiver_api.add_routes(
+                path=path,
+                methods=[apigwv2.HttpMethod.POST],
+                integration=receiver_integration,
+            )
 
-        # ReDoc endpoint: /redoc
-        redoc_resource = self.receiver_api.root.add_resource("redoc")
-        redoc_resource.add_method(
-            "GET",
-            apigateway.LambdaIntegration(
-                self.webhook_receiver_lambda,
-                proxy=True,
-            ),
-        )
+        # GET /status (reception state), /health, and documentation endpoints
+        for path in ["/status", "/health", "/docs", "/openapi.json", "/redoc"]:
+            self.receiver_api.add_routes(
+                path=path,
+                methods=[apigwv2.HttpMethod.GET],
+                integration=receiver_integration,
+            )
 
         # Custom domain mapping for hooks API (REGIONAL endpoint, no base path)
         # REGIONAL endpoint type provides better latency and lower cost than EDGE.
@@ -684,7 +937,7 @@ class WebhookDeliveryStack(Stack):
             self,
             "TriggerApiCustomDomain",
             domain_name=hooks_domain_name,
-            certificate=hooks_certificate,
+            certificate=api_certificate,
             endpoint_type=apigateway.EndpointType.REGIONAL,
         )
 
@@ -707,24 +960,6 @@ class WebhookDeliveryStack(Stack):
             ),
         )
 
-        # Custom domain mapping for receiver API (REGIONAL endpoint, no base path)
-        # Same pattern as hooks API: REGIONAL endpoint with root path mapping
-        # URLs: https://receiver.vincentchan.cloud/{tenantId}/webhook
-        receiver_custom_domain = apigateway.DomainName(
-            self,
-            "ReceiverApiCustomDomain",
-            domain_name=receiver_domain_name,
-            certificate=receiver_certificate,
-            endpoint_type=apigateway.EndpointType.REGIONAL,
-        )
-
-        # Map to root path (empty base path - no stripping needed)
-        receiver_custom_domain.add_base_path_mapping(
-            self.receiver_api,
-            base_path="",  # Empty = root path, no base path stripping
-            stage=self.receiver_api.deployment_stage,
-        )
-
         # DNS A record for receiver API
         route53.ARecord(
             self,
@@ -732,7 +967,10 @@ class WebhookDeliveryStack(Stack):
             zone=zone,
             record_name="receiver",
             target=route53.RecordTarget.from_alias(
-                targets.ApiGatewayDomain(receiver_custom_domain)
+                targets.ApiGatewayv2DomainProperties(
+                    receiver_custom_domain.regional_domain_name,
+                    receiver_custom_domain.regional_hosted_zone_id,
+                )
             ),
         )
 
@@ -803,3 +1041,45 @@ class WebhookDeliveryStack(Stack):
             value=f"https://receiver.{hosted_zone_url}/health",
             description="Webhook receiver health check endpoint",
         )
+
+    def python_layer(
+        self, construct_id: str, layer_dir: str, description: str
+    ) -> lambda_.LayerVersion:
+        """Bundle a requirements.txt directory into an arm64 Python 3.12 layer."""
+        # The layer output depends only on the pinned requirements and the build
+        # steps, so hash those instead of the directory contents.
+        layer_asset_hash = hashlib.sha256(
+            (
+                Path(layer_dir, "requirements.txt").read_text() + layer_bundling_command
+            ).encode()
+        ).hexdigest()
+
+        pip_cache_dir.mkdir(parents=True, exist_ok=True)
+
+        return lambda_.LayerVersion(
+            self,
+            construct_id,
+            code=lambda_.Code.from_asset(
+                layer_dir,
+                asset_hash_type=AssetHashType.CUSTOM,
+                asset_hash=layer_asset_hash,
+                bundling=BundlingOptions(
+                    image=lambda_.Runtime.PYTHON_3_12.bundling_image,
+                    # Resolve aarch64 wheels (pydantic-core etc.) for Graviton
+                    platform=lambda_.Architecture.ARM_64.docker_platform,
+                    volumes=[
+                        DockerVolume(
+                            container_path="/pip-cache",
+                            host_path=str(pip_cache_dir),
+                        )
+                    ],
+                    environment={"PIP_CACHE_DIR": "/pip-cache"},
+                    command=["bash", "-c", layer_bundling_command],
+                    # Skip Docker when the host has Python 3.12 (shares the pip cache)
+                    local=LocalLayerBundling(layer_dir, pip_cache_dir),
+                ),
+            ),
+            compatible_runtimes=[lambda_.Runtime.PYTHON_3_12],
+            compatible_architectures=[lambda_.Architecture.ARM_64],
+            description=description,
+        )
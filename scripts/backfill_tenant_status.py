@@ -0,0 +1,75 @@
+"""
+Backfill tenantStatus (tenantId#status) on Events written before the
+tenant-status-index existed, so status-filtered listing can use that index.
+
+Idempotent: only items without tenantStatus are updated, and each update is
+conditional on the status read by the scan, so events whose status changes
+meanwhile (which sets tenantStatus itself) are left alone. Safe to re-run.
+
+Usage:
+    python scripts/backfill_tenant_status.py <events-table-name> [--dry-run]
+
+Once it reports no remaining events, deploy with TENANT_STATUS_INDEX_READY=1.
+"""
+
+import argparse
+import boto3
+
+
+def backfill(table_name: str, dry_run: bool = False) -> int:
+    """Set tenantStatus where missing; returns the number of events updated"""
+    table = boto3.resource("dynamodb").Table(table_name)
+    client = table.meta.client
+
+    scan_params = {
+        "ProjectionExpression": "tenantId, eventId, #status",
+        "FilterExpression": "attribute_not_exists(tenantStatus) "
+        + "AND attribute_exists(#status)",
+        "ExpressionAttributeNames": {"#status": "status"},
+    }
+
+    updated = 0
+    skipped = 0
+    while True:
+        response = table.scan(**scan_params)
+
+        for item in response.get("Items", []):
+            tenant_status = f"{item['tenantId']}#{item['status']}"
+            if dry_run:
+                print(
+                    f"Would set {item['tenantId']}/{item['eventId']}: {tenant_status}"
+                )
+                updated += 1
+                continue
+
+            try:
+                table.update_item(
+                    Key={"tenantId": item["tenantId"], "eventId": item["eventId"]},
+                    UpdateExpression="SET tenantStatus = :tenant_status",
+                    ConditionExpression="attribute_not_exists(tenantStatus) "
+                    + "AND #status = :status",
+                    ExpressionAttributeNames={"#status": "status"},
+                    ExpressionAttributeValues={
+                        ":tenant_status": tenant_status,
+                        ":status": item["status"],
+                    },
+                )
+                updated += 1
+            except client.exceptions.ConditionalCheckFailedException:
+                # Status changed since the scan; the writer set tenantStatus
+                skipped += 1
+
+        if "LastEvaluatedKey" not in response:
+            break
+        scan_params["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    print(f"Backfilled tenantStatus on {updated} events ({skipped} changed meanwhile)")
+    return updated
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("table_name", help="Events table name (e.g. PREFIX-Events)")
+    parser.add_argument("--dry-run", action="store_true", help="Only print changes")
+    args = parser.parse_args()
+    backfill(args.table_name, dry_run=args.dry_run)
@@ -1,7 +1,19 @@
+from dataclasses import dataclass
 from typing import Dict, Any
 
+from fastapi import Depends, HTTPException, Request
 
-def get_tenant_from_context(event: Dict[str, Any]) -> Dict[str, Any]:
+
+@dataclass(frozen=True, slots=True)
+class TenantContext:
+    """Tenant identity passed through by the Lambda authorizer"""
+
+    tenant_id: str
+    status: str
+    plan: str
+
+
+def get_tenant_from_context(event: Dict[str, Any]) -> TenantContext:
     """
     Extract tenant identity from API Gateway authorizer.
 
@@ -16,7 +28,7 @@ def get_tenant_from_context(event: Dict[str, Any]) -> Dict[str, Any]:
         event: Lambda event from API Gateway
 
     Returns:
-        Tenant identity dict with tenantId, status, plan
+        TenantContext with tenant_id, status, plan
 
     Raises:
         ValueError: If authorizer context is missing (should not happen with proper config)
@@ -26,8 +38,49 @@ def get_tenant_from_context(event: Dict[str, Any]) -> Dict[str, Any]:
     if not authorizer:
         raise ValueError("Missing authorizer context - authentication required")
 
-    return {
-        "tenantId": authorizer["tenantId"],
-        "status": authorizer.get("status", "active"),
-        "plan": authorizer.get("plan", "free"),
-    }
+    return TenantContext(
+        tenant_id=authorizer["tenantId"],
+        status=authorizer.get("status", "active"),
+        plan=authorizer.get("plan", "free"),
+    )
+
+
+def current_tenant(request: Request) -> TenantContext:
+    """
+    FastAPI dependency for the authenticated tenant.
+
+    The authorizer context is parsed once per request and kept on
+    request.state, so other dependencies on the same request reuse it.
+
+    Raises:
+        HTTPException: 401 if the authorizer context is missing or malformed
+    """
+    tenant = getattr(request.state, "tenant", None)
+    if tenant is None:
+        try:
+            tenant = get_tenant_from_context(request.scope.get("aws.event", {}))
+        except (ValueError, KeyError) as e:
+            raise HTTPException(
+                status_code=401, detail=f"Authentication error: {str(e)}"
+            )
+        request.state.tenant = tenant
+    return tenant
+
+
+def require_own_tenant(
+    tenant_id: str, tenant: TenantContext = Depends(current_tenant)
+) -> TenantContext:
+    """
+    FastAPI dependency for /v1/tenants/{tenant_id} routes.
+
+    Enforces tenant isolation: the path tenant must be the authenticated one.
+
+    Raises:
+        HTTPException: 403 if tenant_id belongs to a different tenant
+    """
+    if tenant_id != tenant.tenant_id:
+        raise HTTPException(
+            status_code=403,
+            detail="Access denied. You can only access your own tenant.",
+        )
+    return tenant
@@ -1,59 +1,211 @@
 import os
-import uuid
+import logging
+import hashlib
+import secrets
+import string
 import time
 import boto3
-from decimal import Decimal
-from typing import Dict, Any, Optional
-
-dynamodb = boto3.resource("dynamodb")
+import orjson
+from boto3.dynamodb.types import TypeSerializer
+from botocore.config import Config
+from typing import Dict, Any, List, Optional, Tuple
+
+# Module-scope clients with keep-alive pooling are reused across warm invocations
+boto_config = Config(
+    tcp_keepalive=os.environ.get("BOTO_TCP_KEEPALIVE") == "1",
+    max_pool_connections=int(os.environ.get("BOTO_MAX_POOL_CONNECTIONS", "10")),
+    retries={"mode": "adaptive", "max_attempts": 3},
+)
+
+# Errors are logged with tracebacks via logging; messages are only formatted
+# when the record is emitted (LOG_LEVEL, default INFO)
+logger = logging.getLogger(__name__)
+logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
+
+dynamodb = boto3.resource("dynamodb", config=boto_config)
 events_table = dynamodb.Table(os.environ["EVENTS_TABLE"])
-
-
-def convert_floats_to_decimals(obj: Any) -> Any:
+tenant_identity_table = dynamodb.Table(os.environ["TENANT_IDENTITY_TABLE"])
+tenant_webhook_config_table = dynamodb.Table(os.environ["TENANT_WEBHOOK_CONFIG_TABLE"])
+
+WEBHOOK_SECRET_ALPHABET = string.ascii_letters + string.digits
+
+# Events expire 1 year after creation (365 days for auditing purposes)
+EVENT_TTL_SECONDS = 365 * 24 * 60 * 60
+
+# list_events query shapes; per call only the key values and Limit are added.
+# Only the list-view fields are read (payload needs get_event); these are also
+# all the tenant-status-index GSI projects, so both queries return one shape.
+LIST_EVENTS_PROJECTION = "eventId, #status, createdAt, attempts, lastAttemptAt"
+TENANT_QUERY_TEMPLATE = {
+    "KeyConditionExpression": "tenantId = :tid",
+    "ProjectionExpression": LIST_EVENTS_PROJECTION,
+    "ExpressionAttributeNames": {"#status": "status"},
+    "ScanIndexForward": False,  # Newest first (descending by createdAt)
+}
+# Status filter: the tenant's own partition of the status GSI, so only this
+# tenant's events are read and every page fills up to Limit
+STATUS_QUERY_TEMPLATE = TENANT_QUERY_TEMPLATE | {
+    "IndexName": "tenant-status-index",
+    "KeyConditionExpression": "tenantStatus = :ts",
+}
+# Events written before tenantStatus existed are missing from that index until
+# scripts/backfill_tenant_status.py has run; until then, query the legacy
+# status-index and filter to the tenant.
+TENANT_STATUS_INDEX_READY = os.environ.get("TENANT_STATUS_INDEX_READY") == "1"
+LEGACY_STATUS_QUERY_TEMPLATE = TENANT_QUERY_TEMPLATE | {
+    "IndexName": "status-index",
+    "KeyConditionExpression": "#status = :status",
+    "FilterExpression": "tenantId = :tid",
+}
+
+# BatchWriteItem accepts at most 25 put requests per call
+BATCH_WRITE_MAX_ITEMS = 25
+BATCH_WRITE_MAX_ATTEMPTS = 5
+
+# Warm-container cache of tenant config lookups: tenantId -> (expires_at, tenant).
+# Ingest resolves the tenant's targetUrl on every event; updates made through
+# this container evict the entry, other containers see them within the TTL.
+TENANT_CONFIG_CACHE_TTL_SECONDS = int(
+    os.environ.get("TENANT_CONFIG_CACHE_TTL_SECONDS", "60")
+)
+TENANT_CONFIG_CACHE_MAX_ENTRIES = 1000
+_tenant_config_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+
+# Items are built with str/int values only (payloads are stored as JSON text)
+serializer = TypeSerializer()
+
+
+def hash_api_key(api_key: str) -> str:
     """
-    Recursively convert float values to Decimal for DynamoDB compatibility.
-    DynamoDB requires Decimal type for numbers, not Python float.
+    Return the TenantIdentity partition key for an API key.
+
+    Only the SHA-256 hex digest is stored, so a table read never exposes
+    usable API keys. Must match hash_api_key in the authorizer.
     """
-    if isinstance(obj, float):
-        return Decimal(str(obj))
-    elif isinstance(obj, dict):
-        return {k: convert_floats_to_decimals(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [convert_floats_to_decimals(item) for item in obj]
-    else:
-        return obj
+    return hashlib.sha256(api_key.encode()).hexdigest()
 
 
-def create_event(tenant_id: str, payload: Dict[str, Any], target_url: str) -> str:
-    """
-    Create event in DynamoDB with PENDING status.
+def generate_webhook_secret() -> str:
+    """Generate a webhook signing secret (whsec_ + 32 random alphanumerics)"""
+    return "whsec_" + "".join(
+        secrets.choice(WEBHOOK_SECRET_ALPHABET) for _ in range(32)
+    )
 
-    Returns: event_id
-    """
-    event_id = f"evt_{uuid.uuid4().hex[:12]}"
-    created_at = time.time()
 
-    # TTL: 1 year from now (365 days for auditing purposes)
-    ttl = int(created_at + (365 * 24 * 60 * 60))
+def generate_event_id() -> str:
+    """Generate a new event ID (evt_ + 72 random bits, URL-safe base64)"""
+    return f"evt_{secrets.token_urlsafe(9)}"
 
-    # Convert floats to Decimals for DynamoDB compatibility
-    payload_decimal = convert_floats_to_decimals(payload)
+
+def build_event_item(
+    tenant_id: str, payload_json: str, target_url: str, event_id: str
+) -> Dict[str, Any]:
+    """
+    Build a serialized (low-level client format) PENDING event item.
+
+    The payload is stored as its JSON text (payloadJson), not as a Map, so it
+    is never converted to and from DynamoDB types.
+    """
+    created_at = int(time.time())
 
     item = {
         "tenantId": tenant_id,
         "eventId": event_id,
         "status": "PENDING",
-        "createdAt": str(int(created_at)),
-        "payload": payload_decimal,
+        "tenantStatus": f"{tenant_id}#PENDING",
+        "createdAt": str(created_at),
+        "payloadJson": payload_json,
         "targetUrl": target_url,
         "attempts": 0,
-        "ttl": ttl,
+        "ttl": created_at + EVENT_TTL_SECONDS,
     }
 
-    events_table.put_item(Item=item)
+    return {k: serializer.serialize(v) for k, v in item.items()}
+
+
+def create_event(
+    tenant_id: str,
+    payload_json: str,
+    target_url: str,
+    event_id: Optional[str] = None,
+) -> str:
+    """
+    Create event in DynamoDB with PENDING status.
+
+    payload_json is the payload's JSON text, stored as received.
+
+    Pass event_id when the ID must be known before the write (e.g. to enqueue
+    concurrently); otherwise a new one is generated.
+
+    Returns: event_id
+    """
+    event_id = event_id or generate_event_id()
+
+    dynamodb.meta.client.put_item(
+        TableName=events_table.name,
+        Item=build_event_item(tenant_id, payload_json, target_url, event_id),
+    )
     return event_id
 
 
+def create_events_batch(
+    tenant_id: str, payloads: List[Dict[str, Any]], target_url: str
+) -> Tuple[List[str], List[str]]:
+    """
+    Create several PENDING events with BatchWriteItem (25 items per request).
+
+    Unprocessed items are retried with exponential backoff. Chunks commit
+    independently, so a failure does not undo earlier chunks: every chunk is
+    attempted and the events that were not written are reported instead.
+    Blocks while backing off; call it from a worker thread in async code.
+
+    Returns: (event_ids in the same order as payloads, event_ids not stored)
+    """
+    event_ids = [generate_event_id() for _ in payloads]
+    put_requests = [
+        {
+            "PutRequest": {
+                "Item": build_event_item(
+                    tenant_id, orjson.dumps(p).decode(), target_url, e
+                )
+            }
+        }
+        for p, e in zip(payloads, event_ids)
+    ]
+
+    unstored_ids = []
+    client = dynamodb.meta.client
+    for start in range(0, len(put_requests), BATCH_WRITE_MAX_ITEMS):
+        request_items = {
+            events_table.name: put_requests[start : start + BATCH_WRITE_MAX_ITEMS]
+        }
+        try:
+            for attempt in range(BATCH_WRITE_MAX_ATTEMPTS):
+                response = client.batch_write_item(RequestItems=request_items)
+                request_items = response.get("UnprocessedItems")
+                if not request_items:
+                    break
+                time.sleep(0.05 * 2**attempt)
+            else:
+                logger.error(
+                    "%d events for tenant %s left unprocessed after retries",
+                    len(request_items[events_table.name]),
+                    tenant_id,
+                )
+        except Exception:
+            logger.exception("Error storing event batch for tenant %s", tenant_id)
+
+        # Whatever is still pending in this chunk was not written
+        if request_items:
+            unstored_ids.extend(
+                request["PutRequest"]["Item"]["eventId"]["S"]
+                for request in request_items[events_table.name]
+            )
+
+    return event_ids, unstored_ids
+
+
 def list_events(
     tenant_id: str,
     status: Optional[str] = None,
@@ -71,41 +223,32 @@ def list_events(
 
     Returns:
         {
-            "events": [...],
+            "events": [...],  # eventId, status, createdAt, attempts, lastAttemptAt
             "lastEvaluatedKey": {...} or None
         }
     """
     limit = min(limit, 100)  # Cap at 100
 
-    if status:
-        # Query using GSI when filtering by status
-        query_params = {
-            "IndexName": "status-index",
-            "KeyConditionExpression": "#status = :status",
-            "ExpressionAttributeNames": {"#status": "status"},
+    if status and TENANT_STATUS_INDEX_READY:
+        query_params = STATUS_QUERY_TEMPLATE | {
+            "ExpressionAttributeValues": {":ts": f"{tenant_id}#{status}"},
+            "Limit": limit,
+        }
+    elif status:
+        query_params = LEGACY_STATUS_QUERY_TEMPLATE | {
             "ExpressionAttributeValues": {":status": status, ":tid": tenant_id},
-            "FilterExpression": "tenantId = :tid",
             "Limit": limit,
-            "ScanIndexForward": False,  # Newest first (descending by createdAt)
         }
-
-        if last_evaluated_key:
-            query_params["ExclusiveStartKey"] = last_evaluated_key
-
-        response = events_table.query(**query_params)
     else:
-        # Query by tenant_id without status filter
-        query_params = {
-            "KeyConditionExpression": "tenantId = :tid",
+        query_params = TENANT_QUERY_TEMPLATE | {
             "ExpressionAttributeValues": {":tid": tenant_id},
             "Limit": limit,
-            "ScanIndexForward": False,  # Newest first
         }
 
-        if last_evaluated_key:
-            query_params["ExclusiveStartKey"] = last_evaluated_key
+    if last_evaluated_key:
+        query_params["ExclusiveStartKey"] = last_evaluated_key
 
-        response = events_table.query(**query_params)
+    response = events_table.query(**query_params)
 
     return {
         "events": response.get("Items", []),
@@ -132,50 +275,69 @@ def get_event(tenant_id: str, event_id: str) -> Optional[Dict[str, Any]]:
             }
         )
         return response.get("Item")
-    except Exception as e:
-        print(f"Error retrieving event {event_id} for tenant {tenant_id}: {e}")
+    except Exception:
+        logger.exception("Error retrieving event %s for tenant %s", event_id, tenant_id)
         return None
 
 
-def mark_event_as_purged(tenant_id: str, event_id: str) -> bool:
-    """
-    Mark an event as PURGED status.
-    Used when DLQ messages are purged.
+def get_event_payload(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Decode an event item's payload (payloadJson, or a legacy payload Map)"""
+    if "payloadJson" in item:
+        return orjson.loads(item["payloadJson"])
+    return item["payload"]
 
-    Args:
-        tenant_id: Tenant identifier
-        event_id: Event identifier
 
-    Returns:
-        True if event was updated, False if event not found
+def mark_events_failed(
+    tenant_id: str, event_ids: List[str], error_message: str
+) -> None:
     """
-    try:
-        events_table.update_item(
-            Key={
-                "tenantId": tenant_id,
-                "eventId": event_id,
-            },
-            UpdateExpression="SET #status = :purged",
-            ExpressionAttributeNames={"#status": "status"},
-            ExpressionAttributeValues={":purged": "PURGED"},
-        )
-        return True
-    except Exception as e:
-        print(f"Error marking event {event_id} as purged: {e}")
-        return False
+    Mark PENDING events FAILED (e.g. stored but never enqueued), so they can be
+    retried through the retry endpoint. Attempts are left unchanged.
+
+    Events that have already left PENDING are skipped; errors are logged.
+    """
+    for event_id in event_ids:
+        try:
+            events_table.update_item(
+                Key={
+                    "tenantId": tenant_id,
+                    "eventId": event_id,
+                },
+                UpdateExpression="SET #status = :failed, tenantStatus = :tenant_status, "
+                + "errorMessage = :error",
+                ConditionExpression="#status = :pending",
+                ExpressionAttributeNames={"#status": "status"},
+                ExpressionAttributeValues={
+                    ":failed": "FAILED",
+                    ":tenant_status": f"{tenant_id}#FAILED",
+                    ":error": error_message,
+                    ":pending": "PENDING",
+                },
+            )
+        except events_table.meta.client.exceptions.ConditionalCheckFailedException:
+            pass
+        except Exception:
+            logger.exception("Error marking event %s as FAILED", event_id)
 
 
-def reset_event_for_retry(tenant_id: str, event_id: str) -> bool:
+def reset_event_for_retry(
+    tenant_id: str, event_id: str, max_attempts: int
+) -> Optional[Dict[str, Any]]:
     """
     Reset a FAILED event to PENDING status for manual retry.
     Preserves attempt count to maintain retry history.
 
+    The status and attempt checks are part of the update's condition, so
+    check-and-reset is a single atomic round trip.
+
     Args:
         tenant_id: Tenant identifier
         event_id: Event identifier
+        max_attempts: Only reset events with fewer attempts than this
 
     Returns:
-        True if event was reset, False if event not found or not in FAILED status
+        Updated event dict, or None if event not found, not in FAILED status,
+        or at max_attempts
     """
     try:
         # Update only if status is FAILED (prevent retrying PENDING/DELIVERED events)
@@ -185,22 +347,26 @@ def reset_event_for_retry(tenant_id: str, event_id: str) -> bool:
                 "tenantId": tenant_id,
                 "eventId": event_id,
             },
-            UpdateExpression="SET #status = :pending REMOVE errorMessage",
-            ConditionExpression="#status = :failed",
+            UpdateExpression="SET #status = :pending, tenantStatus = :tenant_status "
+            + "REMOVE errorMessage",
+            ConditionExpression="#status = :failed AND "
+            + "(attribute_not_exists(attempts) OR attempts < :max_attempts)",
             ExpressionAttributeNames={"#status": "status"},
             ExpressionAttributeValues={
                 ":pending": "PENDING",
+                ":tenant_status": f"{tenant_id}#PENDING",
                 ":failed": "FAILED",
+                ":max_attempts": max_attempts,
             },
             ReturnValues="ALL_NEW",
         )
-        return True
+        return response["Attributes"]
     except events_table.meta.client.exceptions.ConditionalCheckFailedException:
-        # Event is not in FAILED status
-        return False
-    except Exception as e:
-        print(f"Error resetting event {event_id} for retry: {e}")
-        return False
+        # Missing, not in FAILED status, or too many attempts
+        return None
+    except Exception:
+        logger.exception("Error resetting event %s for retry", event_id)
+        return None
 
 
 def create_tenant(
@@ -230,71 +396,76 @@ def create_tenant(
     Raises:
         ValueError: If tenant already exists
     """
-    import secrets
-    import string
-
-    tenant_identity_table = dynamodb.Table(os.environ["TENANT_IDENTITY_TABLE"])
-    tenant_webhook_config_table = dynamodb.Table(
-        os.environ["TENANT_WEBHOOK_CONFIG_TABLE"]
-    )
-
     # Generate API key
     api_key = f"tenant_{tenant_id}_key"
 
     # Generate webhook secret if not provided
     if not webhook_secret:
-        # Generate 32-character random secret
-        alphabet = string.ascii_letters + string.digits
-        webhook_secret = "whsec_" + "".join(secrets.choice(alphabet) for _ in range(32))
+        webhook_secret = generate_webhook_secret()
 
     timestamp = str(int(time.time()))
 
-    try:
-        # Write to TenantIdentity table (authentication data)
-        tenant_identity_table.put_item(
-            Item={
-                "apiKey": api_key,
-                "tenantId": tenant_id,
-                "status": "active",
-                "plan": "free",  # Default plan
-                "createdAt": timestamp,
-            },
-            ConditionExpression="attribute_not_exists(apiKey)",
-        )
+    identity_item = {
+        "apiKey": hash_api_key(api_key),
+        "tenantId": tenant_id,
+        "status": "active",
+        "plan": "free",  # Default plan
+        "createdAt": timestamp,
+    }
+    webhook_config_item = {
+        "tenantId": tenant_id,
+        "targetUrl": target_url,
+        "webhookSecret": webhook_secret,
+        "lastUpdated": timestamp,
+    }
 
-        # Write to TenantWebhookConfig table (webhook delivery data)
-        tenant_webhook_config_table.put_item(
-            Item={
-                "tenantId": tenant_id,
-                "targetUrl": target_url,
-                "webhookSecret": webhook_secret,
-                "lastUpdated": timestamp,
-            },
-            ConditionExpression="attribute_not_exists(tenantId)",
+    # Write both tables in one transaction: a single round trip, and either
+    # both rows exist afterwards or neither does
+    client = dynamodb.meta.client
+    try:
+        client.transact_write_items(
+            TransactItems=[
+                {
+                    # TenantIdentity table (authentication data)
+                    "Put": {
+                        "TableName": tenant_identity_table.name,
+                        "Item": {
+                            k: serializer.serialize(v) for k, v in identity_item.items()
+                        },
+                        "ConditionExpression": "attribute_not_exists(apiKey)",
+                    }
+                },
+                {
+                    # TenantWebhookConfig table (webhook delivery data)
+                    "Put": {
+                        "TableName": tenant_webhook_config_table.name,
+                        "Item": {
+                            k: serializer.serialize(v)
+                            for k, v in webhook_config_item.items()
+                        },
+                        "ConditionExpression": "attribute_not_exists(tenantId)",
+                    }
+                },
+            ]
         )
-
-        return {
-            "tenant_id": tenant_id,
-            "api_key": api_key,
-            "target_url": target_url,
-            "webhook_secret": webhook_secret,
-            "created_at": timestamp,
-        }
-    except tenant_identity_table.meta.client.exceptions.ConditionalCheckFailedException:
-        raise ValueError(f"Tenant with ID '{tenant_id}' already exists")
-    except Exception as e:
-        print(f"Error creating tenant {tenant_id}: {e}")
-        # Cleanup: if one table write succeeded, try to rollback
-        try:
-            tenant_identity_table.delete_item(Key={"apiKey": api_key})
-        except:
-            pass
-        try:
-            tenant_webhook_config_table.delete_item(Key={"tenantId": tenant_id})
-        except:
-            pass
+    except client.exceptions.TransactionCanceledException as e:
+        reasons = e.response.get("CancellationReasons", [])
+        if any(r.get("Code") == "ConditionalCheckFailed" for r in reasons):
+            raise ValueError(f"Tenant with ID '{tenant_id}' already exists")
+        logger.exception("Error creating tenant %s", tenant_id)
+        raise
+    except Exception:
+        logger.exception("Error creating tenant %s", tenant_id)
         raise
 
+    return {
+        "tenant_id": tenant_id,
+        "api_key": api_key,
+        "target_url": target_url,
+        "webhook_secret": webhook_secret,
+        "created_at": timestamp,
+    }
+
 
 def get_tenant_by_id(tenant_id: str) -> Optional[Dict[str, Any]]:
     """
@@ -308,13 +479,17 @@ def get_tenant_by_id(tenant_id: str) -> Optional[Dict[str, Any]]:
     Returns:
         Tenant data (excluding webhook secret for security) or None if not found
     """
-    tenant_webhook_config_table = dynamodb.Table(
-        os.environ["TENANT_WEBHOOK_CONFIG_TABLE"]
-    )
+    cached = _tenant_config_cache.get(tenant_id)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
 
     try:
-        # Query TenantWebhookConfig table directly (tenantId is PK)
-        response = tenant_webhook_config_table.get_item(Key={"tenantId": tenant_id})
+        # Query TenantWebhookConfig table directly (tenantId is PK); the
+        # projection keeps webhookSecret out of the response entirely
+        response = tenant_webhook_config_table.get_item(
+            Key={"tenantId": tenant_id},
+            ProjectionExpression="targetUrl, lastUpdated",
+        )
 
         item = response.get("Item")
         if not item:
@@ -330,9 +505,16 @@ def get_tenant_by_id(tenant_id: str) -> Optional[Dict[str, Any]]:
             "updated_at": item.get("lastUpdated", ""),
         }
 
+        if len(_tenant_config_cache) >= TENANT_CONFIG_CACHE_MAX_ENTRIES:
+            _tenant_config_cache.clear()
+        _tenant_config_cache[tenant_id] = (
+            time.monotonic() + TENANT_CONFIG_CACHE_TTL_SECONDS,
+            tenant_safe,
+        )
+
         return tenant_safe
-    except Exception as e:
-        print(f"Error retrieving tenant {tenant_id}: {e}")
+    except Exception:
+        logger.exception("Error retrieving tenant %s", tenant_id)
         return None
 
 
@@ -358,20 +540,6 @@ def update_tenant_config_by_id(
     Raises:
         ValueError: If tenant not found or no fields to update
     """
-    tenant_webhook_config_table = dynamodb.Table(
-        os.environ["TENANT_WEBHOOK_CONFIG_TABLE"]
-    )
-
-    # Check if tenant exists
-    try:
-        response = tenant_webhook_config_table.get_item(Key={"tenantId": tenant_id})
-        if not response.get("Item"):
-            raise ValueError(f"Tenant {tenant_id} not found")
-    except Exception as e:
-        if isinstance(e, ValueError):
-            raise
-        raise ValueError(f"Tenant {tenant_id} not found")
-
     # Build update expression dynamically
     update_parts = []
     attr_values = {}
@@ -382,29 +550,61 @@ def update_tenant_config_by_id(
 
     if webhook_secret:
         update_parts.append("webhookSecret = :secret")
-        # Optionally track rotation history
-        update_parts.append("lastUpdated = :timestamp")
         attr_values[":secret"] = webhook_secret
-        attr_values[":timestamp"] = str(int(time.time()))
 
     if not update_parts:
         raise ValueError("At least one field must be updated")
 
-    # Add lastUpdated timestamp if not already added
-    if "lastUpdated" not in update_parts:
-        update_parts.append("lastUpdated = :timestamp")
-        attr_values[":timestamp"] = str(int(time.time()))
+    # Track when the config (e.g. secret rotation) last changed
+    update_parts.append("lastUpdated = :timestamp")
+    attr_values[":timestamp"] = str(int(time.time()))
 
     update_expression = "SET " + ", ".join(update_parts)
 
+    # The condition doubles as the existence check: one round trip, no race
+    # between checking and updating
     try:
         response = tenant_webhook_config_table.update_item(
             Key={"tenantId": tenant_id},
             UpdateExpression=update_expression,
+            ConditionExpression="attribute_exists(tenantId)",
             ExpressionAttributeValues=attr_values,
             ReturnValues="ALL_NEW",
         )
+        _tenant_config_cache.pop(tenant_id, None)
         return response["Attributes"]
-    except Exception as e:
-        print(f"Error updating tenant config for tenant {tenant_id}: {e}")
+    except (
+        tenant_webhook_config_table.meta.client.exceptions.ConditionalCheckFailedException
+    ):
+        raise ValueError(f"Tenant {tenant_id} not found")
+    except Exception:
+        logger.exception("Error updating tenant config for tenant %s", tenant_id)
         raise
+
+
+def warm_up_connection() -> None:
+    """
+    Open the DynamoDB connection during the init phase.
+
+    A get_item for a key that never exists resolves credentials and the
+    endpoint and completes the TLS handshake before the first request, so that
+    cost lands in init instead of the first request's latency. Skipped for
+    SnapStart, where connections opened before the snapshot are not reusable
+    after restore. Never raises: a failed warm-up just leaves the work to the
+    first real call.
+    """
+    if os.environ.get("AWS_LAMBDA_INITIALIZATION_TYPE") not in (
+        "on-demand",
+        "provisioned-concurrency",
+    ):
+        return
+    try:
+        dynamodb.meta.client.get_item(
+            TableName=events_table.name,
+            Key={"tenantId": {"S": "__warmup__"}, "eventId": {"S": "__warmup__"}},
+        )
+    except Exception:
+        logger.warning("DynamoDB warm-up failed", exc_info=True)
+
+
+warm_up_connection()
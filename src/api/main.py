@@ -1,7 +1,12 @@
+from aws_xray_sdk.core import patch
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from mangum import Mangum
 from routes import router
 
+# Record DynamoDB/SQS/Lambda calls as X-Ray subsegments
+patch(("boto3",))
+
 app = FastAPI(
     title="Webhook Delivery API",
     description="Multi-tenant webhook delivery system",
@@ -9,9 +14,19 @@ app = FastAPI(
     docs_url="/v1/docs",
     redoc_url="/v1/redoc",
     openapi_url="/v1/openapi.json",
+    # Render responses with orjson (in the web layer) instead of stdlib json
+    default_response_class=ORJSONResponse,
 )
 
 app.include_router(router)
 
-# Mangum handler for AWS Lambda
-handler = Mangum(app)
+# Mangum handler for AWS Lambda. No startup/shutdown hooks, so skip the ASGI
+# lifespan cycle. Routes carry the /v1 prefix themselves, so no base path.
+mangum_handler = Mangum(app, lifespan="off")
+
+
+def handler(event, context):
+    """Lambda entry point: answer scheduled warmer pings, otherwise run the app."""
+    if event.get("warmer"):
+        return {"warmed": True}
+    return mangum_handler(event, context)
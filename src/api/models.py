@@ -1,15 +1,25 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
 from typing import Any, Dict, Optional, List
 from decimal import Decimal
-import base64
-import json
+import binascii
+import orjson
+
+
+def replace_decimals(value: Any) -> Any:
+    """Recursively convert DynamoDB Decimals to int or float"""
+    if isinstance(value, Decimal):
+        return int(value) if value % 1 == 0 else float(value)
+    if isinstance(value, dict):
+        return {k: replace_decimals(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [replace_decimals(v) for v in value]
+    return value
 
 
 class EventCreateRequest(BaseModel):
     """Free-form JSON payload for event creation"""
 
-    class Config:
-        extra = "allow"
+    model_config = ConfigDict(extra="allow")
 
 
 class EventCreateResponse(BaseModel):
@@ -17,6 +27,17 @@ class EventCreateResponse(BaseModel):
     status: str  # "PENDING"
 
 
+class EventBatchCreateResponse(BaseModel):
+    """Response for POST /v1/events/batch"""
+
+    event_ids: List[str]
+    status: str  # "PENDING"
+    # Events that were not stored (they do not exist; resubmit their payloads)
+    failed_to_store: List[str] = []
+    # Stored events that were not queued; marked FAILED, retry via /retry
+    failed_to_enqueue: List[str] = []
+
+
 class EventDetail(BaseModel):
     """Single event with full details"""
 
@@ -29,9 +50,10 @@ class EventDetail(BaseModel):
     last_attempt_at: Optional[str] = None
     error_message: Optional[str] = None
 
-    class Config:
-        # Allow Decimal from DynamoDB
-        json_encoders = {Decimal: lambda v: int(v) if v % 1 == 0 else float(v)}
+    @field_serializer("payload", when_used="json")
+    def serialize_payload(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        # Payload numbers come back from DynamoDB as Decimal
+        return replace_decimals(payload)
 
 
 class EventListItem(BaseModel):
@@ -43,9 +65,6 @@ class EventListItem(BaseModel):
     attempts: int
     last_attempt_at: Optional[str] = None
 
-    class Config:
-        json_encoders = {Decimal: lambda v: int(v) if v % 1 == 0 else float(v)}
-
 
 class EventListResponse(BaseModel):
     """Response for GET /v1/events"""
@@ -75,8 +94,7 @@ class EventUpdate(BaseModel):
 
     status: Optional[str] = None
 
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
 
 class TenantConfigUpdate(BaseModel):
@@ -85,9 +103,8 @@ class TenantConfigUpdate(BaseModel):
     target_url: Optional[str] = None
     webhook_secret: Optional[str] = None
 
-    class Config:
-        # At least one field must be provided
-        extra = "forbid"
+    # At least one field must be provided (checked in the route)
+    model_config = ConfigDict(extra="forbid")
 
 
 class TenantCreate(BaseModel):
@@ -97,8 +114,7 @@ class TenantCreate(BaseModel):
     target_url: str = Field(..., pattern="^https?://")
     webhook_secret: Optional[str] = None
 
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
 
 class TenantCreateResponse(BaseModel):
@@ -127,11 +143,20 @@ class TenantDetailResponse(BaseModel):
     tenant: TenantDetail
 
 
+def decimal_default(obj: Any) -> Any:
+    """orjson default: serialize DynamoDB Decimals as int or float"""
+    if isinstance(obj, Decimal):
+        return int(obj) if obj % 1 == 0 else float(obj)
+    raise TypeError
+
+
 def encode_pagination_token(last_evaluated_key: Dict[str, Any]) -> str:
     """Encode DynamoDB LastEvaluatedKey as base64 token"""
     if not last_evaluated_key:
         return None
-    return base64.b64encode(json.dumps(last_evaluated_key).encode()).decode()
+    return binascii.b2a_base64(
+        orjson.dumps(last_evaluated_key, default=decimal_default), newline=False
+    ).decode("ascii")
 
 
 def decode_pagination_token(token: str) -> Dict[str, Any]:
@@ -139,7 +164,7 @@ def decode_pagination_token(token: str) -> Dict[str, Any]:
     if not token:
         return None
     try:
-        return json.loads(base64.b64decode(token.encode()).decode())
+        return orjson.loads(binascii.a2b_base64(token))
     except Exception:
         return None
 
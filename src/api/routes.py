@@ -1,24 +1,32 @@
 import os
-import json
+import logging
+import orjson
+import asyncio
 import boto3
-from fastapi import APIRouter, HTTPException, Request
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import ORJSONResponse
+from typing import Dict, Any, Optional, List
 
-from context import get_tenant_from_context
+from context import TenantContext, current_tenant, require_own_tenant
 from dynamo import (
+    boto_config,
+    generate_event_id,
     create_event,
+    create_events_batch,
     list_events,
     get_event,
+    get_event_payload,
     reset_event_for_retry,
-    mark_event_as_purged,
+    mark_events_failed,
     create_tenant,
     get_tenant_by_id,
     update_tenant_config_by_id,
 )
 from models import (
     EventCreateResponse,
+    EventBatchCreateResponse,
     EventListResponse,
-    EventListItem,
     EventDetailResponse,
     EventDetail,
     TenantCreate,
@@ -36,36 +44,118 @@ from models import (
     DlqPurgeResponse,
 )
 
+# Same logging setup as dynamo.py: deferred %-formatting, LOG_LEVEL (default INFO)
+logger = logging.getLogger(__name__)
+logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
+
 router = APIRouter()
 
-sqs = boto3.client("sqs")
-lambda_client = boto3.client("lambda")
+sqs = boto3.client("sqs", config=boto_config)
 EVENTS_QUEUE_URL = os.environ["EVENTS_QUEUE_URL"]
 EVENTS_DLQ_URL = os.environ.get("EVENTS_DLQ_URL")
 DLQ_PROCESSOR_FUNCTION_NAME = os.environ.get("DLQ_PROCESSOR_FUNCTION_NAME")
+INGEST_PARALLEL = os.environ.get("INGEST_PARALLEL") == "1"
+# Messages per SendMessageBatch call (SQS maximum is 10)
+SQS_BATCH = min(int(os.environ.get("SQS_BATCH", "10")), 10)
+MAX_EVENTS_PER_BATCH = 100
+MAX_MANUAL_RETRY_ATTEMPTS = 5
+
+
+@lru_cache(maxsize=None)
+def get_lambda_client():
+    """
+    Lambda client for the DLQ admin routes, created on first use.
+
+    Only the admin endpoints invoke the DLQ processor, so cold starts that
+    serve event/tenant requests skip loading the Lambda service model.
+    """
+    return boto3.client("lambda")
+
+
+def send_message_chunk(entries: List[Dict[str, str]]) -> List[str]:
+    """Send one SendMessageBatch call; returns the Ids of failed entries."""
+    try:
+        response = sqs.send_message_batch(QueueUrl=EVENTS_QUEUE_URL, Entries=entries)
+    except Exception:
+        logger.exception("Error enqueuing batch of %d messages to SQS", len(entries))
+        return [entry["Id"] for entry in entries]
+
+    for failure in response.get("Failed", []):
+        logger.error(
+            "Error enqueuing message %s to SQS: %s",
+            failure["Id"],
+            failure.get("Message"),
+        )
+    return [failure["Id"] for failure in response.get("Failed", [])]
+
+
+async def enqueue_events(tenant_id: str, event_ids: List[str]) -> List[str]:
+    """
+    Enqueue events for delivery with SendMessageBatch (SQS_BATCH per call).
+
+    The chunks are independent, so they are sent concurrently; a 100-event
+    batch costs about one SQS round trip instead of ten.
+
+    Returns: event_ids that failed to enqueue
+    """
+    entries = [
+        {
+            "Id": str(index),
+            "MessageBody": orjson.dumps(
+                {"tenantId": tenant_id, "eventId": event_id}
+            ).decode(),
+        }
+        for index, event_id in enumerate(event_ids)
+    ]
+    failed_chunks = await asyncio.gather(
+        *(
+            asyncio.to_thread(send_message_chunk, entries[start : start + SQS_BATCH])
+            for start in range(0, len(entries), SQS_BATCH)
+        )
+    )
+    # Entry Ids are indexes into event_ids
+    return [event_ids[int(entry_id)] for failed in failed_chunks for entry_id in failed]
 
 
 @router.post(
-    "/v1/events", status_code=201, response_model=EventCreateResponse, tags=["Events"]
+    "/v1/events",
+    status_code=201,
+    responses={201: {"model": EventCreateResponse}},
+    tags=["Events"],
+    # The body is read raw, so document it here instead of via a parameter
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": {"type": "object"}}},
+        }
+    },
 )
-async def ingest_event(request: Request, payload: Dict[str, Any]):
+async def ingest_event(
+    request: Request, tenant: TenantContext = Depends(current_tenant)
+):
     """
     Ingest event: store in DynamoDB and enqueue to SQS for delivery.
 
+    The JSON object body is stored as received (payloadJson) and delivered
+    byte-for-byte; it is only parsed to check that it is an object.
+
     Authentication is handled by API Gateway Lambda authorizer.
-    Tenant context is extracted from request.scope["aws.event"].
+    Tenant context comes from the current_tenant dependency.
 
     Note: /v1 prefix matches API Gateway resource structure.
     """
-    # Extract Lambda event from Mangum
-    event = request.scope.get("aws.event", {})
+    tenant_id = tenant.tenant_id
 
+    raw_body = await request.body()
     try:
-        tenant = get_tenant_from_context(event)
-    except (ValueError, KeyError) as e:
-        raise HTTPException(status_code=401, detail=f"Authentication error: {str(e)}")
-
-    tenant_id = tenant["tenantId"]
+        is_object = isinstance(orjson.loads(raw_body), dict)
+    except orjson.JSONDecodeError:
+        is_object = False
+    if not is_object:
+        raise HTTPException(
+            status_code=422, detail="Request body must be a JSON object"
+        )
+    payload_json = raw_body.decode()
 
     # Fetch targetUrl from TenantWebhookConfig (not available in authorizer context)
     tenant_config = get_tenant_by_id(tenant_id)
@@ -76,35 +166,158 @@ async def ingest_event(request: Request, payload: Dict[str, Any]):
         )
     target_url = tenant_config["target_url"]
 
-    # Store event in DynamoDB
-    event_id = create_event(tenant_id, payload, target_url)
+    # Store event in DynamoDB and enqueue to SQS for worker to process.
+    # The DynamoDB write stays on the ingest path: the queue message only
+    # carries IDs, the worker reads payload/targetUrl/attempts from the row,
+    # and GET/list/retry need the event to exist as soon as we return.
+    event_id = generate_event_id()
+    message_body = orjson.dumps({"tenantId": tenant_id, "eventId": event_id}).decode()
+
+    if INGEST_PARALLEL:
+        # Write the row and enqueue concurrently. The worker retries a message
+        # that arrives before its row is readable.
+        stored, enqueued = await asyncio.gather(
+            asyncio.to_thread(
+                create_event, tenant_id, payload_json, target_url, event_id
+            ),
+            asyncio.to_thread(
+                sqs.send_message,
+                QueueUrl=EVENTS_QUEUE_URL,
+                MessageBody=message_body,
+            ),
+            return_exceptions=True,
+        )
+        store_error = stored if isinstance(stored, Exception) else None
+        enqueue_error = enqueued if isinstance(enqueued, Exception) else None
+    else:
+        try:
+            create_event(tenant_id, payload_json, target_url, event_id)
+            store_error = None
+        except Exception as e:
+            store_error = e
+        enqueue_error = None
+        if not store_error:
+            try:
+                sqs.send_message(
+                    QueueUrl=EVENTS_QUEUE_URL,
+                    MessageBody=message_body,
+                )
+            except Exception as e:
+                enqueue_error = e
+
+    if store_error:
+        # In parallel mode the message may already be queued. Its row never
+        # appears, so the worker drops it after one short-delay retry
+        # (see process_record); the event ID is not returned to the client.
+        logger.error(
+            "Error storing event %s for tenant %s",
+            event_id,
+            tenant_id,
+            exc_info=store_error,
+        )
+        raise HTTPException(status_code=500, detail="Failed to store event")
+
+    if enqueue_error:
+        logger.error(
+            "Error enqueuing event %s to SQS", event_id, exc_info=enqueue_error
+        )
+        raise HTTPException(status_code=500, detail="Failed to enqueue event")
+
+    # Fixed-shape response: skip response_model validation and encode directly
+    return ORJSONResponse({"event_id": event_id, "status": "PENDING"}, status_code=201)
 
-    # Enqueue to SQS for worker to process
-    message_body = json.dumps(
-        {
-            "tenantId": tenant_id,
-            "eventId": event_id,
-        }
-    )
 
+@router.post(
+    "/v1/events/batch",
+    status_code=201,
+    responses={
+        201: {"model": EventBatchCreateResponse},
+        207: {
+            "model": EventBatchCreateResponse,
+            "description": "Some events were not stored or enqueued "
+            + "(see failed_to_store / failed_to_enqueue)",
+        },
+    },
+    tags=["Events"],
+)
+async def ingest_events_batch(
+    payloads: List[Dict[str, Any]], tenant: TenantContext = Depends(current_tenant)
+):
+    """
+    Ingest up to 100 events in one request.
+
+    Each payload is stored as its own event (same as POST /v1/events), and the
+    queue messages are sent with SendMessageBatch in chunks of SQS_BATCH.
+    Event IDs are returned in the same order as the payloads.
+
+    Events are stored and enqueued independently, so a partial failure does
+    not fail the whole request: the response is 207 and lists
+    - failed_to_store: events that were not stored (resubmit their payloads)
+    - failed_to_enqueue: stored events that were not queued; they are marked
+      FAILED, so POST /v1/events/{event_id}/retry resends them
+    """
+    if not payloads or len(payloads) > MAX_EVENTS_PER_BATCH:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Batch must contain between 1 and {MAX_EVENTS_PER_BATCH} events",
+        )
+
+    tenant_id = tenant.tenant_id
+
+    tenant_config = get_tenant_by_id(tenant_id)
+    if not tenant_config:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Tenant {tenant_id} webhook configuration not found",
+        )
+    target_url = tenant_config["target_url"]
+
+    # Runs in a thread: BatchWriteItem retries back off with time.sleep
     try:
-        sqs.send_message(
-            QueueUrl=EVENTS_QUEUE_URL,
-            MessageBody=message_body,
+        event_ids, unstored_ids = await asyncio.to_thread(
+            create_events_batch, tenant_id, payloads, target_url
+        )
+    except Exception:
+        # Raised before any write (e.g. building the items)
+        logger.exception("Error storing event batch for tenant %s", tenant_id)
+        raise HTTPException(status_code=500, detail="Failed to store events")
+
+    unstored = set(unstored_ids)
+    stored_ids = [event_id for event_id in event_ids if event_id not in unstored]
+    if not stored_ids:
+        # Nothing was written, so the whole request can safely be retried
+        raise HTTPException(status_code=500, detail="Failed to store events")
+
+    unqueued_ids = await enqueue_events(tenant_id, stored_ids)
+
+    # Stored but never queued: PENDING would never be delivered or retryable
+    if unqueued_ids:
+        await asyncio.to_thread(
+            mark_events_failed,
+            tenant_id,
+            unqueued_ids,
+            "Failed to enqueue for delivery",
         )
-    except Exception as e:
-        print(f"Error enqueuing to SQS: {e}")
-        raise HTTPException(status_code=500, detail="Failed to enqueue event")
 
-    return EventCreateResponse(event_id=event_id, status="PENDING")
+    return ORJSONResponse(
+        {
+            "event_ids": event_ids,
+            "status": "PENDING",
+            "failed_to_store": unstored_ids,
+            "failed_to_enqueue": unqueued_ids,
+        },
+        status_code=207 if unstored_ids or unqueued_ids else 201,
+    )
 
 
-@router.get("/v1/events", response_model=EventListResponse, tags=["Events"])
+@router.get(
+    "/v1/events", responses={200: {"model": EventListResponse}}, tags=["Events"]
+)
 async def list_tenant_events(
-    request: Request,
     status: Optional[str] = None,
     limit: int = 50,
     next_token: Optional[str] = None,
+    tenant: TenantContext = Depends(current_tenant),
 ):
     """
     List all events for the authenticated tenant.
@@ -117,15 +330,7 @@ async def list_tenant_events(
     Returns paginated list of events with summary information.
     Authentication via Bearer token required (API Gateway Lambda Authorizer).
     """
-    # Extract tenant context from Lambda Authorizer
-    event = request.scope.get("aws.event", {})
-
-    try:
-        tenant = get_tenant_from_context(event)
-    except (ValueError, KeyError) as e:
-        raise HTTPException(status_code=401, detail=f"Authentication error: {str(e)}")
-
-    tenant_id = tenant["tenantId"]
+    tenant_id = tenant.tenant_id
 
     # Validate status parameter if provided
     if status and status not in ["PENDING", "DELIVERED", "FAILED", "PURGED"]:
@@ -148,29 +353,33 @@ async def list_tenant_events(
         result = list_events(
             tenant_id, status=status, limit=limit, last_evaluated_key=last_evaluated_key
         )
-    except Exception as e:
-        print(f"Error listing events for tenant {tenant_id}: {e}")
+    except Exception:
+        logger.exception("Error listing events for tenant %s", tenant_id)
         raise HTTPException(status_code=500, detail="Failed to retrieve events")
 
-    # Convert to response model
+    # Build the EventListResponse shape as plain dicts and encode it once with
+    # orjson. Items come from our own table writes, so there is nothing to
+    # validate; attempts is a DynamoDB Decimal, which orjson cannot encode.
     events_list = [
-        EventListItem(
-            event_id=item["eventId"],
-            status=item["status"],
-            created_at=item["createdAt"],
-            attempts=item.get("attempts", 0),
-            last_attempt_at=item.get("lastAttemptAt"),
-        )
+        {
+            "event_id": item["eventId"],
+            "status": item["status"],
+            "created_at": item["createdAt"],
+            "attempts": int(item.get("attempts", 0)),
+            "last_attempt_at": item.get("lastAttemptAt"),
+        }
         for item in result["events"]
     ]
 
     # Encode next pagination token
     next_pagination_token = encode_pagination_token(result.get("lastEvaluatedKey"))
 
-    return EventListResponse(
-        events=events_list,
-        next_token=next_pagination_token,
-        total_count=len(events_list),
+    return ORJSONResponse(
+        {
+            "events": events_list,
+            "next_token": next_pagination_token,
+            "total_count": len(events_list),
+        }
     )
 
 
@@ -178,8 +387,8 @@ async def list_tenant_events(
     "/v1/events/{event_id}", response_model=EventDetailResponse, tags=["Events"]
 )
 async def get_event_details(
-    request: Request,
     event_id: str,
+    tenant: TenantContext = Depends(current_tenant),
 ):
     """
     Get detailed information about a specific event.
@@ -193,15 +402,7 @@ async def get_event_details(
     Raises:
     - 404: Event not found or does not belong to authenticated tenant
     """
-    # Extract tenant context from Lambda Authorizer
-    event = request.scope.get("aws.event", {})
-
-    try:
-        tenant = get_tenant_from_context(event)
-    except (ValueError, KeyError) as e:
-        raise HTTPException(status_code=401, detail=f"Authentication error: {str(e)}")
-
-    tenant_id = tenant["tenantId"]
+    tenant_id = tenant.tenant_id
 
     # Retrieve event from DynamoDB
     event_data = get_event(tenant_id, event_id)
@@ -213,13 +414,13 @@ async def get_event_details(
         )
 
     # Convert to response model
-    event_detail = EventDetail(
+    event_detail = EventDetail.model_construct(
         event_id=event_data["eventId"],
         status=event_data["status"],
         created_at=event_data["createdAt"],
-        payload=event_data["payload"],
+        payload=get_event_payload(event_data),
         target_url=event_data["targetUrl"],
-        attempts=event_data.get("attempts", 0),
+        attempts=int(event_data.get("attempts", 0)),
         last_attempt_at=event_data.get("lastAttemptAt"),
         error_message=event_data.get("errorMessage"),
     )
@@ -229,8 +430,8 @@ async def get_event_details(
 
 @router.post("/v1/events/{event_id}/retry", response_model=EventDetail, tags=["Events"])
 async def retry_event(
-    request: Request,
     event_id: str,
+    tenant: TenantContext = Depends(current_tenant),
 ):
     """
     Retry a failed event.
@@ -250,80 +451,67 @@ async def retry_event(
     - 400: Event is not in FAILED status (only FAILED events can be retried)
     - 500: Failed to reset event status or requeue event
     """
-    # Extract tenant context from Lambda Authorizer
-    event_context = request.scope.get("aws.event", {})
-
-    try:
-        tenant = get_tenant_from_context(event_context)
-    except (ValueError, KeyError) as e:
-        raise HTTPException(status_code=401, detail=f"Authentication error: {str(e)}")
+    tenant_id = tenant.tenant_id
 
-    tenant_id = tenant["tenantId"]
-
-    # First verify event exists and belongs to tenant
-    event_data = get_event(tenant_id, event_id)
+    # Reset event to PENDING in DynamoDB (preserves attempt count). The
+    # update is conditional on the checks below and returns the new item, so
+    # the event is only read again to explain a rejected retry.
+    updated_event_data = reset_event_for_retry(
+        tenant_id, event_id, max_attempts=MAX_MANUAL_RETRY_ATTEMPTS
+    )
 
-    if not event_data:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Event {event_id} not found or does not belong to your tenant",
-        )
+    if not updated_event_data:
+        event_data = get_event(tenant_id, event_id)
 
-    # Verify event is in FAILED status
-    if event_data["status"] != "FAILED":
-        raise HTTPException(
-            status_code=400,
-            detail=f"Cannot retry event with status '{event_data['status']}'. Only FAILED events can be retried.",
-        )
+        if not event_data:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Event {event_id} not found or does not belong to your tenant",
+            )
 
-    # Prevent excessive manual retries
-    # Each manual retry creates a NEW SQS message (not a retry of existing message)
-    # This can create many duplicate messages if retried repeatedly
-    # After 5 manual retries, encourage using DLQ requeue endpoint instead
-    attempts = event_data.get("attempts", 0)
-    if attempts >= 5:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Event has {attempts} attempts. Manual retries create new SQS messages and can lead to duplicate processing. "
-            f"For events with 5+ attempts, check DLQ first (GET /v1/admin/dlq/messages) and use POST /v1/admin/dlq/requeue if needed.",
-        )
+        # Verify event is in FAILED status
+        if event_data["status"] != "FAILED":
+            raise HTTPException(
+                status_code=400,
+                detail=f"Cannot retry event with status '{event_data['status']}'. Only FAILED events can be retried.",
+            )
 
-    # Reset event to PENDING in DynamoDB (preserves attempt count)
-    success = reset_event_for_retry(tenant_id, event_id)
+        # Prevent excessive manual retries
+        # Each manual retry creates a NEW SQS message (not a retry of existing message)
+        # This can create many duplicate messages if retried repeatedly
+        # After 5 manual retries, encourage using DLQ requeue endpoint instead
+        attempts = event_data.get("attempts", 0)
+        if attempts >= MAX_MANUAL_RETRY_ATTEMPTS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Event has {attempts} attempts. Manual retries create new SQS messages and can lead to duplicate processing. "
+                f"For events with 5+ attempts, check DLQ first (GET /v1/admin/dlq/messages) and use POST /v1/admin/dlq/requeue if needed.",
+            )
 
-    if not success:
         raise HTTPException(status_code=500, detail="Failed to reset event status")
 
     # Requeue to SQS
-    message_body = json.dumps(
-        {
-            "tenantId": tenant_id,
-            "eventId": event_id,
-        }
-    )
+    message_body = orjson.dumps({"tenantId": tenant_id, "eventId": event_id}).decode()
 
     try:
         sqs.send_message(
             QueueUrl=EVENTS_QUEUE_URL,
             MessageBody=message_body,
         )
-    except Exception as e:
-        print(f"Error requeuing event {event_id} to SQS: {e}")
+    except Exception:
+        logger.exception("Error requeuing event %s to SQS", event_id)
         raise HTTPException(
             status_code=500, detail="Failed to requeue event for delivery"
         )
 
-    # Fetch updated event
-    updated_event_data = get_event(tenant_id, event_id)
-
     # Convert to response model
-    event_detail = EventDetail(
+    event_detail = EventDetail.model_construct(
         event_id=updated_event_data["eventId"],
         status=updated_event_data["status"],
         created_at=updated_event_data["createdAt"],
-        payload=updated_event_data["payload"],
+        payload=get_event_payload(updated_event_data),
         target_url=updated_event_data["targetUrl"],
-        attempts=updated_event_data.get("attempts", 0),
+        attempts=int(updated_event_data.get("attempts", 0)),
         last_attempt_at=updated_event_data.get("lastAttemptAt"),
         error_message=updated_event_data.get("errorMessage"),
     )
@@ -337,10 +525,7 @@ async def retry_event(
     status_code=201,
     tags=["Demo Tenants"],
 )
-async def create_new_tenant(
-    request: Request,
-    tenant: TenantCreate,
-):
+async def create_new_tenant(tenant: TenantCreate):
     """
     Create a new tenant with auto-generated API key.
 
@@ -370,8 +555,8 @@ async def create_new_tenant(
         )
     except ValueError as e:
         raise HTTPException(status_code=409, detail=str(e))
-    except Exception as e:
-        print(f"Error creating tenant {tenant.tenant_id}: {e}")
+    except Exception:
+        logger.exception("Error creating tenant %s", tenant.tenant_id)
         raise HTTPException(status_code=500, detail="Failed to create tenant")
 
     return TenantCreateResponse(
@@ -390,8 +575,8 @@ async def create_new_tenant(
     tags=["Demo Tenants"],
 )
 async def get_tenant(
-    request: Request,
     tenant_id: str,
+    tenant: TenantContext = Depends(require_own_tenant),
 ):
     """
     Get tenant details.
@@ -408,23 +593,6 @@ async def get_tenant(
     - 403: Access denied - trying to access different tenant
     - 404: Tenant not found
     """
-    # Extract tenant context from Lambda Authorizer
-    event = request.scope.get("aws.event", {})
-
-    try:
-        tenant = get_tenant_from_context(event)
-    except (ValueError, KeyError) as e:
-        raise HTTPException(status_code=401, detail=f"Authentication error: {str(e)}")
-
-    auth_tenant_id = tenant["tenantId"]
-
-    # Enforce tenant isolation: can only access own tenant
-    if tenant_id != auth_tenant_id:
-        raise HTTPException(
-            status_code=403,
-            detail="Access denied. You can only access your own tenant details.",
-        )
-
     # Retrieve tenant details
     tenant_data = get_tenant_by_id(tenant_id)
 
@@ -432,7 +600,7 @@ async def get_tenant(
         raise HTTPException(status_code=404, detail=f"Tenant {tenant_id} not found")
 
     # Convert to response model
-    tenant_detail = TenantDetail(
+    tenant_detail = TenantDetail.model_construct(
         tenant_id=tenant_data["tenant_id"],
         target_url=tenant_data["target_url"],
         created_at=tenant_data["created_at"],
@@ -448,9 +616,9 @@ async def get_tenant(
     tags=["Demo Tenants"],
 )
 async def update_tenant(
-    request: Request,
     tenant_id: str,
     config: TenantConfigUpdate,
+    tenant: TenantContext = Depends(require_own_tenant),
 ):
     """
     Update tenant webhook configuration.
@@ -473,23 +641,6 @@ async def update_tenant(
     - 403: Access denied - trying to update different tenant
     - 404: Tenant not found
     """
-    # Extract tenant context from Lambda Authorizer
-    event = request.scope.get("aws.event", {})
-
-    try:
-        tenant = get_tenant_from_context(event)
-    except (ValueError, KeyError) as e:
-        raise HTTPException(status_code=401, detail=f"Authentication error: {str(e)}")
-
-    auth_tenant_id = tenant["tenantId"]
-
-    # Enforce tenant isolation: can only update own tenant
-    if tenant_id != auth_tenant_id:
-        raise HTTPException(
-            status_code=403,
-            detail="Access denied. You can only update your own tenant configuration.",
-        )
-
     # Validate at least one field is provided
     if not config.target_url and not config.webhook_secret:
         raise HTTPException(
@@ -506,8 +657,8 @@ async def update_tenant(
         )
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
-    except Exception as e:
-        print(f"Error updating tenant config for {tenant_id}: {e}")
+    except Exception:
+        logger.exception("Error updating tenant config for %s", tenant_id)
         raise HTTPException(
             status_code=500, detail="Failed to update tenant configuration"
         )
@@ -515,7 +666,7 @@ async def update_tenant(
     return TenantConfigResponse(
         tenant_id=tenant_id,
         target_url=updated_config["targetUrl"],
-        updated_at=updated_config["updatedAt"],
+        updated_at=updated_config["lastUpdated"],
         message="Tenant configuration updated successfully",
     )
 
@@ -530,7 +681,9 @@ async def update_tenant(
     response_model=DlqMessagesResponse,
     tags=["DLQ Management"],
 )
-async def get_dlq_messages(request: Request, limit: int = 10):
+async def get_dlq_messages(
+    limit: int = 10, tenant: TenantContext = Depends(current_tenant)
+):
     """
     List messages currently in the Dead Letter Queue.
 
@@ -542,14 +695,6 @@ async def get_dlq_messages(request: Request, limit: int = 10):
 
     Authentication via Bearer token required (API Gateway Lambda Authorizer).
     """
-    # Extract tenant context from Lambda Authorizer
-    event = request.scope.get("aws.event", {})
-
-    try:
-        tenant = get_tenant_from_context(event)
-    except (ValueError, KeyError) as e:
-        raise HTTPException(status_code=401, detail=f"Authentication error: {str(e)}")
-
     if not EVENTS_DLQ_URL:
         raise HTTPException(
             status_code=500, detail="DLQ URL not configured in environment"
@@ -577,7 +722,7 @@ async def get_dlq_messages(request: Request, limit: int = 10):
             DlqMessage(
                 messageId=msg["MessageId"],
                 receiptHandle=msg["ReceiptHandle"],
-                body=json.loads(msg["Body"]),
+                body=orjson.loads(msg["Body"]),
                 attributes=msg.get("Attributes", {}),
             )
             for msg in messages
@@ -585,17 +730,19 @@ async def get_dlq_messages(request: Request, limit: int = 10):
 
         return DlqMessagesResponse(messages=dlq_messages)
 
-    except Exception as e:
-        print(f"Error retrieving DLQ messages: {e}")
+    except Exception:
+        logger.exception("Error retrieving DLQ messages")
         raise HTTPException(status_code=500, detail="Failed to retrieve DLQ messages")
 
 
 @router.post(
     "/v1/admin/dlq/requeue",
-    response_model=DlqRequeueResponse,
+    responses={200: {"model": DlqRequeueResponse}},
     tags=["DLQ Management"],
 )
-async def requeue_dlq_messages(request: Request, req: DlqRequeueRequest):
+async def requeue_dlq_messages(
+    req: DlqRequeueRequest, tenant: TenantContext = Depends(current_tenant)
+):
     """
     Requeue messages from DLQ back to the main events queue.
 
@@ -613,14 +760,6 @@ async def requeue_dlq_messages(request: Request, req: DlqRequeueRequest):
 
     Authentication via Bearer token required (API Gateway Lambda Authorizer).
     """
-    # Extract tenant context from Lambda Authorizer
-    event = request.scope.get("aws.event", {})
-
-    try:
-        tenant = get_tenant_from_context(event)
-    except (ValueError, KeyError) as e:
-        raise HTTPException(status_code=401, detail=f"Authentication error: {str(e)}")
-
     if not DLQ_PROCESSOR_FUNCTION_NAME:
         raise HTTPException(
             status_code=500,
@@ -629,10 +768,10 @@ async def requeue_dlq_messages(request: Request, req: DlqRequeueRequest):
 
     try:
         # Invoke DLQ Processor Lambda
-        response = lambda_client.invoke(
+        response = get_lambda_client().invoke(
             FunctionName=DLQ_PROCESSOR_FUNCTION_NAME,
             InvocationType="RequestResponse",
-            Payload=json.dumps(
+            Payload=orjson.dumps(
                 {
                     "batchSize": req.batchSize,
                     "maxMessages": req.maxMessages,
@@ -641,22 +780,22 @@ async def requeue_dlq_messages(request: Request, req: DlqRequeueRequest):
         )
 
         # Parse response
-        response_payload = json.loads(response["Payload"].read())
+        response_payload = orjson.loads(response["Payload"].read())
         if response.get("FunctionError"):
             raise Exception(f"Lambda error: {response_payload}")
 
         # DLQ Processor returns statusCode and body
         if isinstance(response_payload, dict) and "body" in response_payload:
-            result = json.loads(response_payload["body"])
+            result = orjson.loads(response_payload["body"])
         else:
             result = response_payload
 
-        return DlqRequeueResponse(
-            requeued=result.get("requeued", 0), failed=result.get("failed", 0)
+        return ORJSONResponse(
+            {"requeued": result.get("requeued", 0), "failed": result.get("failed", 0)}
         )
 
     except Exception as e:
-        print(f"Error invoking DLQ Processor: {e}")
+        logger.exception("Error invoking DLQ Processor")
         raise HTTPException(
             status_code=500, detail=f"Failed to requeue DLQ messages: {str(e)}"
         )
@@ -664,87 +803,65 @@ async def requeue_dlq_messages(request: Request, req: DlqRequeueRequest):
 
 @router.post(
     "/v1/admin/dlq/purge",
-    response_model=DlqPurgeResponse,
+    status_code=202,
+    responses={202: {"model": DlqPurgeResponse}},
     tags=["DLQ Management"],
 )
-async def purge_dlq(request: Request):
+async def purge_dlq(tenant: TenantContext = Depends(current_tenant)):
     """
     Completely purge all messages from the Dead Letter Queue.
 
     ⚠️ **Warning**: This operation is irreversible. All messages in the DLQ will be permanently deleted.
 
-    Returns confirmation with the DLQ URL that was purged.
+    The purge runs asynchronously in the DLQ Processor Lambda, which marks each
+    DLQ event as PURGED and then purges the queue. Returns 202 once the purge
+    has been started.
 
     Authentication via Bearer token required (API Gateway Lambda Authorizer).
     """
-    # Extract tenant context from Lambda Authorizer
-    event = request.scope.get("aws.event", {})
+    if not EVENTS_DLQ_URL or not DLQ_PROCESSOR_FUNCTION_NAME:
+        raise HTTPException(
+            status_code=500,
+            detail="DLQ URL or DLQ Processor function not configured in environment",
+        )
 
     try:
-        tenant = get_tenant_from_context(event)
-    except (ValueError, KeyError) as e:
-        raise HTTPException(status_code=401, detail=f"Authentication error: {str(e)}")
-
-    if not EVENTS_DLQ_URL:
-        raise HTTPException(
-            status_code=500, detail="DLQ URL not configured in environment"
+        get_lambda_client().invoke(
+            FunctionName=DLQ_PROCESSOR_FUNCTION_NAME,
+            InvocationType="Event",
+            Payload=orjson.dumps({"action": "purge"}),
         )
+    except Exception as e:
+        logger.exception("Error invoking DLQ Processor for purge")
+        raise HTTPException(status_code=500, detail=f"Failed to purge DLQ: {str(e)}")
 
+    return ORJSONResponse(
+        {"status": "purging", "queue": EVENTS_DLQ_URL}, status_code=202
+    )
+
+
+def warm_up_sqs() -> None:
+    """
+    Load the SQS service model and open the queue connection during init.
+
+    Loading the operation models needs no network and is also captured by
+    SnapStart snapshots. The get_queue_attributes call (covered by the send
+    grant) resolves credentials and completes the TLS handshake, so it only
+    runs for on-demand/provisioned init, not before a snapshot. Never raises.
+    """
     try:
-        # First, read all DLQ messages to get event IDs before purging
-        events_marked = 0
-        events_failed = 0
-
-        # Receive messages in batches to extract event IDs
-        # Note: We don't delete messages here - purge_queue will delete all messages
-        max_iterations = 100  # Safety limit to prevent infinite loops
-        iteration = 0
-
-        while iteration < max_iterations:
-            iteration += 1
-            response = sqs.receive_message(
-                QueueUrl=EVENTS_DLQ_URL,
-                MaxNumberOfMessages=10,  # Max batch size
-                WaitTimeSeconds=0,  # Don't wait, return immediately
+        for operation in ("SendMessage", "SendMessageBatch"):
+            sqs.meta.service_model.operation_model(operation)
+
+        if os.environ.get("AWS_LAMBDA_INITIALIZATION_TYPE") in (
+            "on-demand",
+            "provisioned-concurrency",
+        ):
+            sqs.get_queue_attributes(
+                QueueUrl=EVENTS_QUEUE_URL, AttributeNames=["QueueArn"]
             )
+    except Exception:
+        logger.warning("SQS warm-up failed", exc_info=True)
 
-            messages = response.get("Messages", [])
-            if not messages:
-                # No more messages
-                break
-
-            # Extract event IDs and mark events as PURGED
-            for message in messages:
-                try:
-                    body = json.loads(message["Body"])
-                    tenant_id = body.get("tenantId")
-                    event_id = body.get("eventId")
-
-                    if tenant_id and event_id:
-                        if mark_event_as_purged(tenant_id, event_id):
-                            events_marked += 1
-                        else:
-                            events_failed += 1
-                    else:
-                        print(f"Invalid message format in DLQ: {body}")
-                        events_failed += 1
-                except Exception as e:
-                    print(f"Error processing DLQ message: {e}")
-                    events_failed += 1
-
-            # If we got fewer than max messages, we've read all available
-            if len(messages) < 10:
-                break
-
-        # Now purge the DLQ (this deletes all messages)
-        sqs.purge_queue(QueueUrl=EVENTS_DLQ_URL)
-
-        print(
-            f"Purged DLQ: marked {events_marked} events as PURGED, {events_failed} failed"
-        )
-
-        return DlqPurgeResponse(status="purged", queue=EVENTS_DLQ_URL)
 
-    except Exception as e:
-        print(f"Error purging DLQ: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to purge DLQ: {str(e)}")
+warm_up_sqs()
@@ -1,38 +1,123 @@
 import os
+import hashlib
+import logging
+import time
 import boto3
-from typing import Dict, Any, Optional
-
-dynamodb = boto3.resource("dynamodb")
-tenant_identity_table = dynamodb.Table(os.environ["TENANT_IDENTITY_TABLE"])
+from collections import OrderedDict
+from aws_xray_sdk.core import patch
+from boto3.dynamodb.types import TypeDeserializer
+from botocore.config import Config
+from typing import Dict, Any, Optional, Tuple
+
+# Module-scope clients with keep-alive pooling are reused across warm invocations
+boto_config = Config(
+    tcp_keepalive=os.environ.get("BOTO_TCP_KEEPALIVE") == "1",
+    max_pool_connections=int(os.environ.get("BOTO_MAX_POOL_CONNECTIONS", "10")),
+    retries={"mode": "adaptive", "max_attempts": 3},
+)
+
+# Module logger: %-style messages are formatted only when emitted (LOG_LEVEL)
+logger = logging.getLogger(__name__)
+logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
+
+# Record DynamoDB calls as X-Ray subsegments
+patch(("boto3",))
+
+# Low-level client: the single get_item per lookup skips the resource layer's
+# per-call model handling; only the projected attributes are deserialized.
+dynamodb = boto3.client("dynamodb", config=boto_config)
+TENANT_IDENTITY_TABLE = os.environ["TENANT_IDENTITY_TABLE"]
+deserializer = TypeDeserializer()
+
+# Identity fields only; "status" and "plan" are DynamoDB reserved keywords
+IDENTITY_PROJECTION = "tenantId, #status, #plan, createdAt"
+IDENTITY_ATTRIBUTE_NAMES = {"#status": "status", "#plan": "plan"}
+
+# Warm-container LRU cache of API key lookups: apiKey -> (expires_at, tenant).
+# API Gateway caches the policy per token; this covers authorizer invocations
+# that miss that cache but land on a container that already saw the key.
+# Unknown/inactive keys are cached briefly (tenant None) so repeated bad keys
+# don't each cost a DynamoDB read.
+TENANT_CACHE_TTL_SECONDS = int(os.environ.get("TENANT_CACHE_TTL_SECONDS", "300"))
+TENANT_NEGATIVE_CACHE_TTL_SECONDS = 5
+TENANT_CACHE_MAX_ENTRIES = 4096
+_tenant_cache: "OrderedDict[str, Tuple[float, Optional[Dict]]]" = OrderedDict()
 
 
 def get_tenant_from_api_key(api_key: str) -> Optional[Dict]:
+    """
+    Look up tenant identity from API key, using the warm-container cache first.
+
+    Lookup errors are not cached, so a throttled read is retried on the next
+    request instead of denying a valid key.
+    """
+    cached = _tenant_cache.get(api_key)
+    if cached and cached[0] > time.monotonic():
+        _tenant_cache.move_to_end(api_key)
+        return cached[1]
+
+    try:
+        tenant = fetch_tenant_from_api_key(api_key)
+    except Exception:
+        logger.exception("Error looking up API key")
+        return None
+
+    ttl = TENANT_CACHE_TTL_SECONDS if tenant else TENANT_NEGATIVE_CACHE_TTL_SECONDS
+    _tenant_cache[api_key] = (time.monotonic() + ttl, tenant)
+    _tenant_cache.move_to_end(api_key)
+    if len(_tenant_cache) > TENANT_CACHE_MAX_ENTRIES:
+        _tenant_cache.popitem(last=False)
+
+    return tenant
+
+
+def fetch_tenant_from_api_key(api_key: str) -> Optional[Dict]:
     """
     Look up tenant identity from API key in DynamoDB.
 
     Uses projection expression to only retrieve tenantId, status, plan, createdAt.
     Never accesses webhook secrets (stored in separate TenantWebhookConfig table).
 
-    Returns tenant identity if valid and active, None otherwise.
+    Returns tenant identity if valid and active, None otherwise. DynamoDB
+    errors propagate to the caller.
     """
-    try:
-        # Use ProjectionExpression to limit fields retrieved (least privilege)
-        # Note: Both "status" and "plan" are DynamoDB reserved keywords, so we alias them
-        response = tenant_identity_table.get_item(
-            Key={"apiKey": api_key},
-            ProjectionExpression="tenantId, #status, #plan, createdAt",
-            ExpressionAttributeNames={"#status": "status", "#plan": "plan"},
-        )
-        item = response.get("Item")
-
-        if not item or item.get("status") != "active":
-            return None
-
-        return item
-    except Exception as e:
-        print(f"Error looking up API key: {e}")
+    key_hash = hash_api_key(api_key)
+    item = get_identity_item(key_hash)
+    if not item and not is_key_hash(api_key):
+        # Tenants created before keys were hashed are stored under the raw key.
+        # A stored hash presented as a token must not match its own row.
+        item = get_identity_item(api_key)
+
+    if not item or item.get("status") != "active":
         return None
 
+    return item
+
+
+def hash_api_key(api_key: str) -> str:
+    """Return the TenantIdentity partition key for an API key (SHA-256 hex)."""
+    return hashlib.sha256(api_key.encode()).hexdigest()
+
+
+def is_key_hash(value: str) -> bool:
+    """True if value has the shape of a stored key hash (64 hex chars)."""
+    return len(value) == 64 and all(c in "0123456789abcdef" for c in value)
+
+
+def get_identity_item(key: str) -> Optional[Dict]:
+    """Read a TenantIdentity item, projecting only identity fields."""
+    # Use ProjectionExpression to limit fields retrieved (least privilege)
+    response = dynamodb.get_item(
+        TableName=TENANT_IDENTITY_TABLE,
+        Key={"apiKey": {"S": key}},
+        ProjectionExpression=IDENTITY_PROJECTION,
+        ExpressionAttributeNames=IDENTITY_ATTRIBUTE_NAMES,
+    )
+    item = response.get("Item")
+    if not item:
+        return None
+    return {k: deserializer.deserialize(v) for k, v in item.items()}
+
 
 def generate_policy(
     principal_id: str, effect: str, resource: str, context: Dict[str, Any] = None
@@ -63,25 +148,42 @@ def generate_policy(
     return policy
 
 
+def get_authorization_header(event: Dict) -> str:
+    """Return the Authorization value from a TOKEN or REQUEST authorizer event."""
+    if event.get("type") == "TOKEN":
+        return event.get("authorizationToken", "")
+
+    # REQUEST events carry the raw headers; header names are case-insensitive
+    headers = event.get("headers") or {}
+    for name, value in headers.items():
+        if name.lower() == "authorization":
+            return value or ""
+    return ""
+
+
 def handler(event: Dict, context: Any) -> Dict:
     """
-    Lambda authorizer for API Gateway TOKEN type.
+    Lambda authorizer for API Gateway REQUEST type (TOKEN also accepted).
 
     Event structure:
     {
-        "type": "TOKEN",
-        "authorizationToken": "Bearer <api-key>",
+        "type": "REQUEST",
+        "headers": {"Authorization": "Bearer <api-key>", ...},
         "methodArn": "arn:aws:execute-api:..."
     }
 
     Returns IAM policy with tenant context or Deny policy.
     """
-    token = event.get("authorizationToken", "")
+    # Scheduled warmer ping: module is already loaded, nothing to authorize
+    if event.get("warmer"):
+        return {"warmed": True}
+
+    token = get_authorization_header(event)
     method_arn = event["methodArn"]
 
     # Extract Bearer token
     if not token.startswith("Bearer "):
-        print("Missing or invalid Authorization header format")
+        logger.info("Missing or invalid Authorization header format")
         return generate_policy("anonymous", "Deny", method_arn)
 
     api_key = token[7:]  # Remove "Bearer " prefix
@@ -90,7 +192,7 @@ def handler(event: Dict, context: Any) -> Dict:
     tenant = get_tenant_from_api_key(api_key)
 
     if not tenant:
-        print(f"Invalid or inactive API key")
+        logger.info("Invalid or inactive API key")
         return generate_policy("anonymous", "Deny", method_arn)
 
     # Generate Allow policy with tenant context
@@ -108,5 +210,5 @@ def handler(event: Dict, context: Any) -> Dict:
         "plan": tenant.get("plan", "free"),
     }
 
-    print(f"Authorized tenant: {tenant_id}")
+    logger.info("Authorized tenant: %s", tenant_id)
     return generate_policy(tenant_id, "Allow", resource_arn, context_data)
@@ -1,18 +1,37 @@
 import os
 import json
+import logging
 import boto3
+from concurrent.futures import ThreadPoolExecutor
+
+# Module logger: %-style messages are formatted only when emitted (LOG_LEVEL)
+logger = logging.getLogger(__name__)
+logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
 
 sqs = boto3.client("sqs")
+dynamodb = boto3.resource("dynamodb")
 
 DLQ_URL = os.environ["EVENTS_DLQ_URL"]
 MAIN_QUEUE_URL = os.environ["EVENTS_QUEUE_URL"]
+events_table = dynamodb.Table(os.environ["EVENTS_TABLE"])
 
 
 def main(event, context):
     """
-    Manually triggered Lambda to requeue DLQ messages.
+    Manually triggered Lambda for DLQ maintenance.
+
+    Actions (event["action"]):
+    - "requeue" (default): move DLQ messages back to the main queue
+    - "purge": mark DLQ events as PURGED, then purge the DLQ
+    """
+    if event.get("action") == "purge":
+        return purge_dlq()
+    return requeue_dlq(event)
 
-    Reads messages from DLQ and sends them back to main queue.
+
+def requeue_dlq(event):
+    """
+    Read messages from DLQ and send them back to main queue.
     Use with caution - only requeue if confident the issue is resolved.
     """
     batch_size = event.get("batchSize", 10)
@@ -33,33 +52,67 @@ def main(event, context):
         if not messages:
             break
 
+        # Validate messages have required fields
+        valid_messages = []
         for message in messages:
             try:
-                # Validate message has required fields
                 body = json.loads(message["Body"])
-                if "tenantId" not in body or "eventId" not in body:
-                    print(f"Invalid message format: {body}")
-                    failed_count += 1
-                    continue
-
-                # Requeue to main queue
-                sqs.send_message(
-                    QueueUrl=MAIN_QUEUE_URL,
-                    MessageBody=message["Body"],
-                )
-
-                # Delete from DLQ
-                sqs.delete_message(
-                    QueueUrl=DLQ_URL,
-                    ReceiptHandle=message["ReceiptHandle"],
-                )
-
-                requeued_count += 1
-                print(f"✓ Requeued: {body['tenantId']}/{body['eventId']}")
-
-            except Exception as e:
-                print(f"Error processing message: {e}")
+            except ValueError:
+                body = None
+            if (
+                not isinstance(body, dict)
+                or "tenantId" not in body
+                or "eventId" not in body
+            ):
+                logger.warning("Invalid message format: %s", message["Body"])
                 failed_count += 1
+                continue
+            valid_messages.append(message)
+
+        if not valid_messages:
+            continue
+
+        # Requeue to main queue (one SendMessageBatch for up to 10 messages)
+        try:
+            sent = sqs.send_message_batch(
+                QueueUrl=MAIN_QUEUE_URL,
+                Entries=[
+                    {"Id": str(i), "MessageBody": message["Body"]}
+                    for i, message in enumerate(valid_messages)
+                ],
+            )
+        except Exception:
+            logger.exception("Error requeueing batch")
+            failed_count += len(valid_messages)
+            continue
+
+        for failure in sent.get("Failed", []):
+            logger.error("Error requeueing message: %s", failure.get("Message"))
+            failed_count += 1
+
+        # Delete from DLQ only the messages that made it to the main queue
+        requeued = [
+            valid_messages[int(entry["Id"])] for entry in sent.get("Successful", [])
+        ]
+        if not requeued:
+            continue
+
+        try:
+            sqs.delete_message_batch(
+                QueueUrl=DLQ_URL,
+                Entries=[
+                    {"Id": str(i), "ReceiptHandle": message["ReceiptHandle"]}
+                    for i, message in enumerate(requeued)
+                ],
+            )
+        except Exception:
+            # Already requeued; the DLQ copy reappears after its visibility timeout
+            logger.exception("Error deleting requeued messages from DLQ")
+
+        for message in requeued:
+            body = json.loads(message["Body"])
+            logger.info("✓ Requeued: %s/%s", body["tenantId"], body["eventId"])
+        requeued_count += len(requeued)
 
     return {
         "statusCode": 200,
@@ -70,3 +123,110 @@ def main(event, context):
             }
         ),
     }
+
+
+def mark_event_as_purged(tenant_id: str, event_id: str) -> bool:
+    """
+    Mark an event as PURGED status.
+
+    Returns:
+        True if event was updated, False on error
+    """
+    try:
+        events_table.update_item(
+            Key={
+                "tenantId": tenant_id,
+                "eventId": event_id,
+            },
+            UpdateExpression="SET #status = :purged, tenantStatus = :tenant_status",
+            ExpressionAttributeNames={"#status": "status"},
+            ExpressionAttributeValues={
+                ":purged": "PURGED",
+                ":tenant_status": f"{tenant_id}#PURGED",
+            },
+        )
+        return True
+    except Exception:
+        logger.exception("Error marking event %s as purged", event_id)
+        return False
+
+
+def purge_dlq():
+    """
+    Mark every event in the DLQ as PURGED, then purge the DLQ.
+
+    Runs asynchronously (invoked with InvocationType="Event" by the API), so
+    the admin request does not wait on the SQS/DynamoDB round trips.
+    """
+    events_marked = 0
+    events_failed = 0
+
+    # Receive messages in batches to extract event IDs
+    # Note: We don't delete messages here - purge_queue will delete all messages
+    max_iterations = 100  # Safety limit to prevent infinite loops
+    iteration = 0
+
+    # Status updates for a batch are independent, so run them concurrently
+    # (10 = SQS receive batch size = default botocore connection pool size)
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        while iteration < max_iterations:
+            iteration += 1
+            response = sqs.receive_message(
+                QueueUrl=DLQ_URL,
+                MaxNumberOfMessages=10,  # Max batch size
+                WaitTimeSeconds=0,  # Don't wait, return immediately
+            )
+
+            messages = response.get("Messages", [])
+            if not messages:
+                # No more messages
+                break
+
+            # Extract event IDs
+            event_keys = []
+            for message in messages:
+                try:
+                    body = json.loads(message["Body"])
+                    tenant_id = body.get("tenantId")
+                    event_id = body.get("eventId")
+
+                    if tenant_id and event_id:
+                        event_keys.append((tenant_id, event_id))
+                    else:
+                        logger.warning("Invalid message format in DLQ: %s", body)
+                        events_failed += 1
+                except Exception:
+                    logger.exception("Error processing DLQ message")
+                    events_failed += 1
+
+            # Mark events as PURGED
+            for marked in executor.map(
+                lambda key: mark_event_as_purged(*key), event_keys
+            ):
+                if marked:
+                    events_marked += 1
+                else:
+                    events_failed += 1
+
+            # If we got fewer than max messages, we've read all available
+            if len(messages) < 10:
+                break
+
+    # Now purge the DLQ (this deletes all messages)
+    sqs.purge_queue(QueueUrl=DLQ_URL)
+
+    logger.info(
+        "Purged DLQ: marked %d events as PURGED, %d failed",
+        events_marked,
+        events_failed,
+    )
+
+    return {
+        "statusCode": 200,
+        "body": json.dumps(
+            {
+                "marked": events_marked,
+                "failed": events_failed,
+            }
+        ),
+    }
@@ -5,11 +5,13 @@ FastAPI-based receiver for webhook delivery validation.
 """
 import os
 import hmac
+import logging
 import hashlib
 import json
+import time
 import boto3
 from fastapi import FastAPI, Request, HTTPException, Header
-from typing import Optional
+from typing import Dict, Optional, Tuple
 from mangum import Mangum
 
 # Initialize FastAPI app
@@ -22,6 +24,10 @@ app = FastAPI(
     openapi_url="/openapi.json",
 )
 
+# Module logger: %-style messages are formatted only when emitted (LOG_LEVEL)
+logger = logging.getLogger(__name__)
+logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
+
 # Module-level DynamoDB initialization (Lambda best practice)
 dynamodb = boto3.resource("dynamodb")
 tenant_webhook_config_table = dynamodb.Table(os.environ["TENANT_WEBHOOK_CONFIG_TABLE"])
@@ -29,6 +35,13 @@ tenant_webhook_config_table = dynamodb.Table(os.environ["TENANT_WEBHOOK_CONFIG_T
 # Special tenantId used to store global webhook reception state
 GLOBAL_CONFIG_TENANT_ID = "__GLOBAL_CONFIG__"
 
+# Warm-container cache of webhook secrets: tenantId -> (expires_at, secret)
+TENANT_CONFIG_CACHE_TTL_SECONDS = int(
+    os.environ.get("TENANT_CONFIG_CACHE_TTL_SECONDS", "60")
+)
+TENANT_CONFIG_CACHE_MAX_ENTRIES = 1000
+_webhook_secret_cache: Dict[str, Tuple[float, str]] = {}
+
 
 def get_webhook_secret_for_tenant(tenant_id: str) -> Optional[str]:
     """
@@ -36,18 +49,32 @@ def get_webhook_secret_for_tenant(tenant_id: str) -> Optional[str]:
 
     Reads only webhook delivery configuration (targetUrl, webhookSecret).
     Does not access TenantIdentity table (authentication data).
+    Found secrets are cached for TENANT_CONFIG_CACHE_TTL_SECONDS.
     """
+    cached = _webhook_secret_cache.get(tenant_id)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+
     try:
-        response = tenant_webhook_config_table.get_item(Key={"tenantId": tenant_id})
+        response = tenant_webhook_config_table.get_item(
+            Key={"tenantId": tenant_id}, ProjectionExpression="webhookSecret"
+        )
         item = response.get("Item")
+    except Exception:
+        logger.exception("Error retrieving webhook secret for tenant %s", tenant_id)
+        return None
 
-        if item:
-            return item.get("webhookSecret")
+    secret = item.get("webhookSecret") if item else None
 
-        return None
-    except Exception as e:
-        print(f"Error retrieving webhook secret for tenant {tenant_id}: {e}")
-        return None
+    if secret:
+        if len(_webhook_secret_cache) >= TENANT_CONFIG_CACHE_MAX_ENTRIES:
+            _webhook_secret_cache.clear()
+        _webhook_secret_cache[tenant_id] = (
+            time.monotonic() + TENANT_CONFIG_CACHE_TTL_SECONDS,
+            secret,
+        )
+
+    return secret
 
 
 def is_webhook_reception_enabled() -> bool:
@@ -58,7 +85,8 @@ def is_webhook_reception_enabled() -> bool:
     """
     try:
         response = tenant_webhook_config_table.get_item(
-            Key={"tenantId": GLOBAL_CONFIG_TENANT_ID}
+            Key={"tenantId": GLOBAL_CONFIG_TENANT_ID},
+            ProjectionExpression="webhookReceptionEnabled",
         )
         item = response.get("Item")
         if item:
@@ -66,8 +94,8 @@ def is_webhook_reception_enabled() -> bool:
             return item.get("webhookReceptionEnabled", True)
         # Default to enabled if not set
         return True
-    except Exception as e:
-        print(f"Error reading webhook reception state: {e}")
+    except Exception:
+        logger.exception("Error reading webhook reception state")
         # Default to enabled on error
         return True
 
@@ -77,8 +105,6 @@ def set_webhook_reception_state(enabled: bool) -> None:
     Set global webhook reception state (applies to all tenants).
     Stores in DynamoDB for persistence across container recycles.
     """
-    import time
-
     try:
         timestamp = str(int(time.time()))
         tenant_webhook_config_table.put_item(
@@ -88,11 +114,12 @@ def set_webhook_reception_state(enabled: bool) -> None:
                 "lastUpdated": timestamp,
             }
         )
-        print(
-            f"Global webhook reception {'enabled' if enabled else 'disabled'} (persisted to DynamoDB)"
+        logger.info(
+            "Global webhook reception %s (persisted to DynamoDB)",
+            "enabled" if enabled else "disabled",
         )
-    except Exception as e:
-        print(f"Error storing webhook reception state: {e}")
+    except Exception:
+        logger.exception("Error storing webhook reception state")
         raise
 
 
@@ -118,7 +145,8 @@ def verify_signature(payload: str, signature_header: str, webhook_secret: str) -
 
         return hmac.compare_digest(expected, signature)
     except Exception as e:
-        print(f"Error verifying signature: {e}")
+        # Malformed header from the sender; not a server error
+        logger.warning("Error verifying signature: %s", e)
         return False
 
 
@@ -134,14 +162,14 @@ async def receive_webhook(
     """
     # Check if webhook reception is enabled globally
     if not is_webhook_reception_enabled():
-        print(f"Webhook reception disabled globally")
+        logger.info("Webhook reception disabled globally")
         raise HTTPException(
             status_code=503, detail="Webhook reception temporarily disabled"
         )
 
     # Validate signature header presence
     if not stripe_signature:
-        print(f"Missing Stripe-Signature header for tenant: {tenant_id}")
+        logger.info("Missing Stripe-Signature header for tenant: %s", tenant_id)
         raise HTTPException(status_code=401, detail="Missing Stripe-Signature header")
 
     # Read raw body for signature verification
@@ -151,21 +179,25 @@ async def receive_webhook(
     # Retrieve webhook secret from DynamoDB
     webhook_secret = get_webhook_secret_for_tenant(tenant_id)
     if not webhook_secret:
-        print(f"No active webhook secret found for tenant: {tenant_id}")
+        logger.info("No active webhook secret found for tenant: %s", tenant_id)
         raise HTTPException(status_code=404, detail="Tenant not found or inactive")
 
     # Verify HMAC signature
     if not verify_signature(payload, stripe_signature, webhook_secret):
-        print(f"Invalid signature for tenant: {tenant_id}")
+        logger.info("Invalid signature for tenant: %s", tenant_id)
         raise HTTPException(status_code=401, detail="Invalid signature")
 
     # Parse JSON payload for logging
     try:
         payload_json = json.loads(payload)
         event_id = payload_json.get("eventId") or payload_json.get("event_id")
-        print(f"✓ Valid webhook received for tenant {tenant_id}, event: {event_id}")
+        logger.info(
+            "✓ Valid webhook received for tenant %s, event: %s", tenant_id, event_id
+        )
     except json.JSONDecodeError:
-        print(f"✓ Valid webhook received for tenant {tenant_id} (non-JSON payload)")
+        logger.info(
+            "✓ Valid webhook received for tenant %s (non-JSON payload)", tenant_id
+        )
 
     return {"status": "received", "tenant_id": tenant_id}
 
@@ -222,5 +254,6 @@ async def health_check():
     return {"status": "healthy", "service": "webhook-receiver"}
 
 
-# Lambda handler using Mangum adapter
-handler = Mangum(app)
+# Lambda handler using Mangum adapter. The app has no startup/shutdown
+# hooks, so skip running the ASGI lifespan cycle on every invocation.
+handler = Mangum(app, lifespan="off")
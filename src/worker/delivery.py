@@ -2,8 +2,21 @@ import json
 import requests
 from decimal import Decimal
 from typing import Dict, Any, Tuple
+from requests.adapters import HTTPAdapter
 from signatures import generate_stripe_signature
 
+# Shared across the concurrent deliveries in a batch and across warm
+# invocations, so repeat deliveries to a tenant reuse open TLS connections.
+# Pool size matches the SQS batch size (one connection per in-flight delivery).
+DELIVERY_POOL_SIZE = 10
+
+session = requests.Session()
+adapter = HTTPAdapter(
+    pool_connections=DELIVERY_POOL_SIZE, pool_maxsize=DELIVERY_POOL_SIZE
+)
+session.mount("https://", adapter)
+session.mount("http://", adapter)
+
 
 class DecimalEncoder(json.JSONEncoder):
     """JSON encoder that handles Decimal types from DynamoDB"""
@@ -15,15 +28,26 @@ class DecimalEncoder(json.JSONEncoder):
         return super(DecimalEncoder, self).default(obj)
 
 
+def get_payload_json(event_item: Dict[str, Any]) -> str:
+    """
+    Webhook body for an event item.
+
+    New events store the payload as received (payloadJson), which is sent
+    as-is; older events store a payload Map, which is serialized here.
+    """
+    if "payloadJson" in event_item:
+        return event_item["payloadJson"]
+    return json.dumps(event_item["payload"], cls=DecimalEncoder)
+
+
 def deliver_webhook(
-    target_url: str, payload: Dict[str, Any], webhook_secret: str, timeout: int = 30
+    target_url: str, payload_json: str, webhook_secret: str, timeout: int = 30
 ) -> Tuple[bool, int, str]:
     """
     Deliver webhook with HMAC signature.
 
     Returns: (success: bool, status_code: int, error_message: str)
     """
-    payload_json = json.dumps(payload, cls=DecimalEncoder)
     signature = generate_stripe_signature(payload_json, webhook_secret)
 
     headers = {
@@ -32,7 +56,7 @@ def deliver_webhook(
     }
 
     try:
-        response = requests.post(
+        response = session.post(
             target_url,
             data=payload_json,
             headers=headers,
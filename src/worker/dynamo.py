@@ -1,17 +1,45 @@
 import os
+import logging
 import time
 import boto3
+from botocore.config import Config
+from typing import Dict, Tuple
 
-dynamodb = boto3.resource("dynamodb")
+# Module-scope clients with keep-alive pooling are reused across warm invocations
+boto_config = Config(
+    tcp_keepalive=os.environ.get("BOTO_TCP_KEEPALIVE") == "1",
+    max_pool_connections=int(os.environ.get("BOTO_MAX_POOL_CONNECTIONS", "10")),
+    retries={"mode": "adaptive", "max_attempts": 3},
+)
+
+# Module logger: %-style messages are formatted only when emitted (LOG_LEVEL)
+logger = logging.getLogger(__name__)
+logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
+
+dynamodb = boto3.resource("dynamodb", config=boto_config)
 events_table = dynamodb.Table(os.environ["EVENTS_TABLE"])
-tenant_webhook_config_table = dynamodb.Table(
-    os.environ["TENANT_WEBHOOK_CONFIG_TABLE"]
+tenant_webhook_config_table = dynamodb.Table(os.environ["TENANT_WEBHOOK_CONFIG_TABLE"])
+
+# Warm-container cache of tenant webhook config: tenantId -> (expires_at, item).
+# A batch usually holds several events for the same tenant; a rotated secret is
+# picked up within the TTL.
+TENANT_CONFIG_CACHE_TTL_SECONDS = int(
+    os.environ.get("TENANT_CONFIG_CACHE_TTL_SECONDS", "60")
 )
+TENANT_CONFIG_CACHE_MAX_ENTRIES = 1000
+_tenant_config_cache: Dict[str, Tuple[float, Dict]] = {}
 
 
 def get_event(tenant_id: str, event_id: str):
-    """Retrieve event from DynamoDB"""
-    response = events_table.get_item(Key={"tenantId": tenant_id, "eventId": event_id})
+    """
+    Retrieve event from DynamoDB.
+
+    Strongly consistent: with parallel ingest the message can arrive right
+    after the put, and an eventually consistent read may miss a written row.
+    """
+    response = events_table.get_item(
+        Key={"tenantId": tenant_id, "eventId": event_id}, ConsistentRead=True
+    )
     return response.get("Item")
 
 
@@ -21,24 +49,45 @@ def get_tenant_by_id(tenant_id: str):
 
     Reads from TenantWebhookConfig table (contains targetUrl and webhookSecret).
     Does not access TenantIdentity table (authentication data).
+    Found configs are cached for TENANT_CONFIG_CACHE_TTL_SECONDS.
     """
+    cached = _tenant_config_cache.get(tenant_id)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+
     try:
-        response = tenant_webhook_config_table.get_item(Key={"tenantId": tenant_id})
-        return response.get("Item")
-    except Exception as e:
-        print(f"Error retrieving tenant webhook config for {tenant_id}: {e}")
+        response = tenant_webhook_config_table.get_item(
+            Key={"tenantId": tenant_id},
+            ProjectionExpression="tenantId, targetUrl, webhookSecret",
+        )
+        item = response.get("Item")
+    except Exception:
+        logger.exception("Error retrieving tenant webhook config for %s", tenant_id)
         return None
 
+    if item:
+        if len(_tenant_config_cache) >= TENANT_CONFIG_CACHE_MAX_ENTRIES:
+            _tenant_config_cache.clear()
+        _tenant_config_cache[tenant_id] = (
+            time.monotonic() + TENANT_CONFIG_CACHE_TTL_SECONDS,
+            item,
+        )
+
+    return item
+
 
 def update_event_status(
     tenant_id: str, event_id: str, status: str, attempts: int, error_message: str = None
 ):
     """Update event delivery status"""
+    # tenantStatus keys the tenant-status-index GSI used by the event list API
     update_expr = (
-        "SET #status = :status, attempts = :attempts, lastAttemptAt = :last_attempt"
+        "SET #status = :status, tenantStatus = :tenant_status, "
+        + "attempts = :attempts, lastAttemptAt = :last_attempt"
     )
     expr_values = {
         ":status": status,
+        ":tenant_status": f"{tenant_id}#{status}",
         ":attempts": attempts,
         ":last_attempt": str(int(time.time())),
     }
@@ -1,12 +1,151 @@
 import json
+import logging
 import os
 import boto3
-from delivery import deliver_webhook
-from dynamo import get_event, update_event_status, get_tenant_by_id
+from aws_xray_sdk.core import patch
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from delivery import deliver_webhook, get_payload_json
+from dynamo import boto_config, get_event, update_event_status, get_tenant_by_id
 
-sqs = boto3.client("sqs")
+# Record DynamoDB/SQS calls and outbound webhook requests as X-Ray subsegments
+patch(("boto3", "requests"))
+
+# Module logger: %-style messages are formatted only when emitted (LOG_LEVEL)
+logger = logging.getLogger(__name__)
+logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
+
+sqs = boto3.client("sqs", config=boto_config)
+EVENTS_QUEUE_URL = os.environ.get("EVENTS_QUEUE_URL")
 EVENTS_DLQ_URL = os.environ.get("EVENTS_DLQ_URL")
 MAX_RETRY_ATTEMPTS = 5
+# Redelivery delay for a message whose event row is not written yet, instead
+# of waiting out the queue's full visibility timeout
+EVENT_NOT_FOUND_RETRY_SECONDS = 5
+
+
+def send_to_dlq(tenant_id: str, event_id: str) -> None:
+    """Send an event reference directly to the DLQ"""
+    # Construct message body explicitly to ensure correct tenantId/eventId
+    dlq_message_body = json.dumps(
+        {
+            "tenantId": tenant_id,
+            "eventId": event_id,
+        }
+    )
+
+    sqs.send_message(
+        QueueUrl=EVENTS_DLQ_URL,
+        MessageBody=dlq_message_body,
+    )
+
+
+def retry_soon(record) -> None:
+    """Make a message visible again after EVENT_NOT_FOUND_RETRY_SECONDS"""
+    if not EVENTS_QUEUE_URL:
+        return
+    try:
+        sqs.change_message_visibility(
+            QueueUrl=EVENTS_QUEUE_URL,
+            ReceiptHandle=record["receiptHandle"],
+            VisibilityTimeout=EVENT_NOT_FOUND_RETRY_SECONDS,
+        )
+    except Exception:
+        # Falls back to the queue's visibility timeout
+        logger.exception("Error shortening visibility for %s", record["messageId"])
+
+
+def process_record(record) -> None:
+    """
+    Deliver the webhook for a single SQS record.
+
+    Returns normally when the message is handled (delivered, sent to DLQ, or
+    unprocessable) and raises when SQS should retry it.
+    """
+    message_body = json.loads(record["body"])
+    tenant_id = message_body["tenantId"]
+    event_id = message_body["eventId"]
+
+    # Get event details
+    event_item = get_event(tenant_id, event_id)
+    if not event_item:
+        # The API writes the row and enqueues concurrently, so on first receipt
+        # the put may still be in flight: retry once, a few seconds from now.
+        if record.get("attributes", {}).get("ApproximateReceiveCount") == "1":
+            retry_soon(record)
+            raise Exception(f"Event not found yet: {tenant_id}/{event_id}")
+        # Still missing on a consistent read: the API's put failed after the
+        # message was sent (the client got a 500), so there is nothing to deliver
+        logger.warning("Event not found, dropping message: %s/%s", tenant_id, event_id)
+        return
+
+    target_url = event_item["targetUrl"]
+    payload_json = get_payload_json(event_item)
+    current_attempts = event_item.get("attempts", 0)
+
+    # Check if event has already exceeded max retry attempts BEFORE attempting delivery
+    # If so, send directly to DLQ without attempting delivery
+    # This prevents processing events that should already be in DLQ
+    if current_attempts >= MAX_RETRY_ATTEMPTS and EVENTS_DLQ_URL:
+        try:
+            send_to_dlq(tenant_id, event_id)
+            logger.info(
+                "→ Sent to DLQ (skipped delivery): %s/%s (attempts=%s >= %s)",
+                tenant_id,
+                event_id,
+                current_attempts,
+                MAX_RETRY_ATTEMPTS,
+            )
+            # Don't re-raise - message handled, delete from main queue
+            return
+        except Exception:
+            logger.exception("Error sending %s/%s to DLQ", tenant_id, event_id)
+            # Fall through to attempt delivery if DLQ send fails
+
+    # Get webhook secret from tenant config
+    tenant = get_tenant_by_id(tenant_id)
+    if not tenant:
+        logger.warning("Tenant not found: %s", tenant_id)
+        return
+
+    webhook_secret = tenant["webhookSecret"]
+
+    # Attempt delivery
+    success, status_code, error_msg = deliver_webhook(
+        target_url, payload_json, webhook_secret
+    )
+
+    new_attempts = current_attempts + 1
+
+    if success:
+        # Mark as DELIVERED
+        update_event_status(tenant_id, event_id, "DELIVERED", new_attempts)
+        logger.info("✓ Delivered: %s/%s (status=%s)", tenant_id, event_id, status_code)
+        return
+
+    # Mark as FAILED
+    update_event_status(tenant_id, event_id, "FAILED", new_attempts, error_msg)
+    logger.info("✗ Failed: %s/%s - %s", tenant_id, event_id, error_msg)
+
+    # Check if event has exceeded max retry attempts after this failed attempt
+    # If so, send directly to DLQ instead of letting SQS retry
+    if new_attempts >= MAX_RETRY_ATTEMPTS and EVENTS_DLQ_URL:
+        try:
+            send_to_dlq(tenant_id, event_id)
+            logger.info(
+                "→ Sent to DLQ: %s/%s (attempts=%s >= %s)",
+                tenant_id,
+                event_id,
+                new_attempts,
+                MAX_RETRY_ATTEMPTS,
+            )
+            # Don't re-raise - message handled, delete from main queue
+            return
+        except Exception:
+            logger.exception("Error sending %s/%s to DLQ", tenant_id, event_id)
+            # Fall through to SQS retry if DLQ send fails
+
+    # Re-raise to trigger SQS retry (for attempts < MAX_RETRY_ATTEMPTS)
+    raise Exception(f"Webhook delivery failed: {error_msg}")
 
 
 def main(event, context):
@@ -14,107 +153,35 @@ def main(event, context):
     Process SQS messages for webhook delivery.
 
     Triggered by SQS event source with:
-    - Max batching window: 0s (messages processed immediately when Lambda polls)
-    - Batch size: 10 messages per invocation
+    - Max batching window: 2s
+    - Batch size: up to 10 messages per invocation
+    - Partial batch responses (ReportBatchItemFailures)
+
+    Records are delivered concurrently so a large batch still fits within the
+    Lambda timeout. Only records that fail are reported back to SQS; the rest
+    are deleted from the queue.
 
     SQS will retry failed messages with exponential backoff:
-    - Visibility timeout: 60s
+    - Visibility timeout: 360s
     - Max receive count: 5
-    - Backoff: ~1min, 2min, 4min, 8min, 16min
     """
-    for record in event["Records"]:
-        message_body = json.loads(record["body"])
-        tenant_id = message_body["tenantId"]
-        event_id = message_body["eventId"]
-
-        # Get event details
-        event_item = get_event(tenant_id, event_id)
-        if not event_item:
-            print(f"Event not found: {tenant_id}/{event_id}")
-            continue
-
-        target_url = event_item["targetUrl"]
-        payload = event_item["payload"]
-        current_attempts = event_item.get("attempts", 0)
-
-        # Check if event has already exceeded max retry attempts BEFORE attempting delivery
-        # If so, send directly to DLQ without attempting delivery
-        # This prevents processing events that should already be in DLQ
-        if current_attempts >= MAX_RETRY_ATTEMPTS and EVENTS_DLQ_URL:
+    records = event["Records"]
+    batch_item_failures = []
+
+    if not records:
+        return {"batchItemFailures": batch_item_failures}
+
+    with ThreadPoolExecutor(max_workers=len(records)) as executor:
+        futures = {
+            executor.submit(process_record, record): record for record in records
+        }
+        for future in as_completed(futures):
+            record = futures[future]
             try:
-                # Construct message body explicitly to ensure correct tenantId/eventId
-                dlq_message_body = json.dumps(
-                    {
-                        "tenantId": tenant_id,
-                        "eventId": event_id,
-                    }
-                )
-
-                # Send message directly to DLQ
-                sqs.send_message(
-                    QueueUrl=EVENTS_DLQ_URL,
-                    MessageBody=dlq_message_body,
-                )
-                print(
-                    f"→ Sent to DLQ (skipped delivery): {tenant_id}/{event_id} (attempts={current_attempts} >= {MAX_RETRY_ATTEMPTS})"
-                )
-                # Don't re-raise - message handled, delete from main queue
-                continue
+                future.result()
             except Exception as e:
-                print(f"Error sending to DLQ: {e}")
-                # Fall through to attempt delivery if DLQ send fails
-
-        # Get webhook secret from tenant config
-        tenant = get_tenant_by_id(tenant_id)
-        if not tenant:
-            print(f"Tenant not found: {tenant_id}")
-            continue
-
-        webhook_secret = tenant["webhookSecret"]
-
-        # Attempt delivery
-        success, status_code, error_msg = deliver_webhook(
-            target_url, payload, webhook_secret
-        )
+                # Expected for failed deliveries (SQS retries them), so no traceback
+                logger.error("Error processing message %s: %s", record["messageId"], e)
+                batch_item_failures.append({"itemIdentifier": record["messageId"]})
 
-        new_attempts = current_attempts + 1
-
-        if success:
-            # Mark as DELIVERED
-            update_event_status(tenant_id, event_id, "DELIVERED", new_attempts)
-            print(f"✓ Delivered: {tenant_id}/{event_id} (status={status_code})")
-        else:
-            # Mark as FAILED
-            update_event_status(tenant_id, event_id, "FAILED", new_attempts, error_msg)
-            print(f"✗ Failed: {tenant_id}/{event_id} - {error_msg}")
-
-            # Check if event has exceeded max retry attempts after this failed attempt
-            # If so, send directly to DLQ instead of letting SQS retry
-            if new_attempts >= MAX_RETRY_ATTEMPTS and EVENTS_DLQ_URL:
-                try:
-                    # Construct message body explicitly to ensure correct tenantId/eventId
-                    dlq_message_body = json.dumps(
-                        {
-                            "tenantId": tenant_id,
-                            "eventId": event_id,
-                        }
-                    )
-
-                    # Send message directly to DLQ
-                    sqs.send_message(
-                        QueueUrl=EVENTS_DLQ_URL,
-                        MessageBody=dlq_message_body,
-                    )
-                    print(
-                        f"→ Sent to DLQ: {tenant_id}/{event_id} (attempts={new_attempts} >= {MAX_RETRY_ATTEMPTS})"
-                    )
-                    # Don't re-raise - message handled, delete from main queue
-                    continue
-                except Exception as e:
-                    print(f"Error sending to DLQ: {e}")
-                    # Fall through to SQS retry if DLQ send fails
-
-            # Re-raise to trigger SQS retry (for attempts < MAX_RETRY_ATTEMPTS)
-            raise Exception(f"Webhook delivery failed: {error_msg}")
-
-    return {"statusCode": 200}
+    return {"batchItemFailures": batch_item_failures}